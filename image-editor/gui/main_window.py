@@ -10,17 +10,50 @@ OOP Concepts Demonstrated:
 - Encapsulation: Private methods for internal operations
 """
 
+import bisect
+import os
+import queue
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from PIL import Image as PILImage, ImageTk
 import cv2
 import numpy as np
-from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache, partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from models.image import Image
 from managers.filter_manager import FilterManager
 
 
+def _build_filter_info_text(filter_manager: FilterManager) -> str:
+    """
+    Build the text shown by Help > Filter Info.
+    
+    Filters are only registered when the FilterManager is created, so the
+    app builds the text once and keeps it (see _show_filter_info).
+    
+    Args:
+        filter_manager (FilterManager): Manager whose filters are listed
+        
+    Returns:
+        str: Filter list followed by the total filter count
+    """
+    info = "Available Filters:\n\n"
+    
+    for key in filter_manager.list_filters():
+        filter_info = filter_manager.get_filter_info(key)
+        if filter_info:
+            info += f"• {filter_info['name']}: {filter_info['description']}\n"
+    
+    # Add statistics
+    stats = FilterManager.get_filter_statistics()
+    info += f"\nTotal Filters: {stats['total_filters']}"
+    
+    return info
+
+
 class ImageEditorApp:
     """
     Main application window for the Image Editor.
@@ -33,10 +66,80 @@ class ImageEditorApp:
         root (tk.Tk): Main window
         _image (Image): Current image object (encapsulated)
         _filter_manager (FilterManager): Manages all filters
-        _display_image (ImageTk.PhotoImage): Image for display
+        _filter_info_text (str): Help > Filter Info text, once built
+        _display_image (PhotoImage): Image for display (ImageTk or tk)
         _zoom_level (float): Current zoom level
+        _image_version (int): Counter bumped whenever the current image changes
+        _rgb_cache (tuple): (image version, RGB array) reused by zoom redraws
+        _preview_src (numpy.ndarray): Downscaled _original_for_sliders
+        _stage_cache (dict): Intermediate preview results, see run_pipeline
+        _preview (tuple): (preview pixels, full-resolution (width, height))
+        _fast_preview (bool): Use nearest-neighbour scaling for interactive zooming
+        _pending_after (str): Tk job id of the pending slider update, if any
+        _last_blur (int): Effective (odd) blur kernel of the last slider update
+        _last_brightness (int): Brightness of the last slider update
+        _last_contrast (float): Contrast (one decimal) of the last slider update
+        _last_resize (int): Resize percentage of the last slider update
+        _redraw_pending (bool): A zoom redraw is queued via after_idle
+        _settle_after (str): Tk job id of the full-quality redraw that follows
+            a fast one, if any
+        _photo_cache (OrderedDict): Recently displayed PhotoImages (LRU)
+        _thumbnail (tuple): (image version, downscaled BGR copy) for display
+        _thumbnail_buf (numpy.ndarray): Buffer the thumbnail is resized into
+        _rgb_buf (numpy.ndarray): Reused destination for BGR to RGB conversion
+        _zoom_buf (numpy.ndarray): Reused destination for the zoom resize
+        _use_opencl (bool): Do display resizes on cv2.UMat (OpenCL)
+        _canvas_image_id (int): Canvas item showing _display_image
+        _display_size (tuple): (width, height) of the displayed image
+        _io_pool (ThreadPoolExecutor): Worker threads for image decoding/encoding
+        _preview_pool (ThreadPoolExecutor): Worker thread for slider previews
+        _filter_pool (ThreadPoolExecutor): Worker thread for permanent filters
+        _pending_filter (Future): Permanent filter still being computed, if any
+        _completed (queue.SimpleQueue): (callback, args) of finished worker
+            jobs, waiting to be run on the Tk thread
+        _poll_after (str): Tk job id of the next _poll_completions, if any
+        _preview_seq (int): Number of the most recent slider preview request
+        _tab_builders (dict): Control panel tabs not built yet, keyed by page name
     """
     
+    # Delay used to coalesce slider drag events (milliseconds)
+    SLIDER_DELAY_MS = 30
+    
+    # Quiet time after the last fast (nearest-neighbour) redraw before the
+    # view is redrawn at full quality (milliseconds)
+    SETTLE_DELAY_MS = 150
+    
+    # Number of PhotoImages kept for quickly switching between zoom levels
+    PHOTO_CACHE_SIZE = 8
+    
+    # How often the Tk thread picks up finished background work (milliseconds)
+    COMPLETION_POLL_MS = 10
+    
+    # Discrete zoom levels used by Zoom In/Out. Fixed values keep the
+    # PhotoImage cache keys stable instead of accumulating float drift.
+    ZOOM_STEPS = (0.1, 0.125, 0.167, 0.25, 0.33, 0.5, 0.67,
+                  1.0, 1.25, 1.5, 2.0, 3.0, 4.0)
+    
+    # Long edge (pixels) of the downscaled copy used for zoomed-out display
+    DISPLAY_THUMBNAIL_SIZE = 2048
+    
+    # Long edge (pixels) of the proxy image slider previews are computed on
+    PREVIEW_MAX_SIZE = 1600
+    
+    # Displayed images up to this many pixels are passed to Tk as PPM data
+    PPM_MAX_PIXELS = 512 * 512
+    
+    # Images larger than this (pixels) are offered a reduced-resolution load
+    MAX_OPEN_PIXELS = 64_000_000
+    
+    # Encoder settings per file extension. OpenCV defaults to JPEG quality
+    # 95 and PNG compression 3; these trade a little size for faster saves.
+    SAVE_PARAMS = {
+        '.jpg': [cv2.IMWRITE_JPEG_QUALITY, 90],
+        '.jpeg': [cv2.IMWRITE_JPEG_QUALITY, 90],
+        '.png': [cv2.IMWRITE_PNG_COMPRESSION, 1],
+    }
+    
     def __init__(self, root: tk.Tk):
         """
         Constructor to initialize the application.
@@ -48,10 +151,75 @@ class ImageEditorApp:
         
         # Instance attributes (encapsulation)
         self._image: Optional[Image] = None
+        self._filename: Optional[str] = None  # Base name of the opened file
+        self._fit_binding: Optional[str] = None  # One-shot <Configure> handler
         self._filter_manager = FilterManager()
+        self._filter_info_text: Optional[str] = None  # Built on first use
         self._display_image: Optional[ImageTk.PhotoImage] = None
         self._zoom_level = 1.0
-        self._original_for_sliders: Optional[np.ndarray] = None  # Store original for slider adjustments
+        # Store original for slider adjustments; set whenever _image is, so
+        # it doubles as the "image loaded" check in the slider callbacks
+        self._original_for_sliders: Optional[np.ndarray] = None
+        
+        # Slider previews run on a downscaled copy of the original; the
+        # result is shown instead of the current image until committed
+        self._preview_src: Optional[np.ndarray] = None
+        self._stage_cache: Dict[tuple, np.ndarray] = {}
+        self._preview: Optional[Tuple[np.ndarray, Tuple[int, int]]] = None
+        
+        # Display cache: the RGB conversion only depends on the pixels, so
+        # zooming can reuse it until the image content changes
+        self._image_version = 0
+        self._rgb_cache: Optional[Tuple[int, np.ndarray]] = None
+        self._fast_preview = False
+        
+        # PhotoImages keyed by (image version, zoom level, interpolation).
+        # Holding them here also keeps Tk from freeing the displayed pixmap.
+        self._photo_cache: 'OrderedDict[Tuple[int, float, int], ImageTk.PhotoImage]' = OrderedDict()
+        self._thumbnail: Optional[Tuple[int, np.ndarray]] = None
+        self._thumbnail_buf: Optional[np.ndarray] = None
+        
+        # Scratch buffers for redraws; only reallocated when the shape changes
+        self._rgb_buf: Optional[np.ndarray] = None
+        self._zoom_buf: Optional[np.ndarray] = None
+        
+        # Run display resizes on the GPU through OpenCL (T-API) when the
+        # OpenCV build and the machine support it
+        self._use_opencl = cv2.ocl.haveOpenCL()
+        
+        # Canvas item reused for every redraw
+        self._canvas_image_id: Optional[int] = None
+        self._display_size: Optional[Tuple[int, int]] = None
+        
+        # Image decoding/encoding runs off the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_open: Optional[Future] = None
+        
+        # Slider previews are filtered on their own worker; only the result
+        # of the newest request (_preview_seq) is shown
+        self._preview_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # Permanent filters run one at a time off the Tk thread
+        self._filter_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_filter: Optional[Future] = None
+        self._preview_seq = 0
+        
+        # Workers never touch Tk: finished jobs are queued here and picked
+        # up by _poll_completions on the Tk thread
+        self._completed: "queue.SimpleQueue[Tuple[Callable[..., None], tuple]]" = queue.SimpleQueue()
+        self._poll_after: Optional[str] = None
+        
+        # Tk job id of the deferred slider update (see _schedule_slider_update)
+        self._pending_after: Optional[str] = None
+        self._redraw_pending = False
+        self._settle_after: Optional[str] = None
+        
+        # Quantized slider values last handed to _schedule_slider_update;
+        # traces that don't change them skip the preview work
+        self._last_blur = 1
+        self._last_brightness = 0
+        self._last_contrast = 1.0
+        self._last_resize = 100
         
         # Configure the main window
         self._setup_window()
@@ -65,6 +233,39 @@ class ImageEditorApp:
         
         # Bind keyboard shortcuts
         self._bind_shortcuts()
+        
+        self._poll_completions()
+    
+    def _when_done(self, future: Future, callback: Callable[..., None], *args) -> None:
+        """
+        Run callback(future, *args) on the Tk thread once future finishes.
+        
+        Done callbacks run on the worker thread, where Tk must not be
+        called (not even root.after), so they only queue the call.
+        
+        Args:
+            future (Future): Background job to wait for
+            callback (callable): Called with the future and args
+            *args: Extra arguments for callback
+        """
+        future.add_done_callback(
+            lambda f: self._completed.put((callback, (f,) + args)))
+    
+    def _poll_completions(self) -> None:
+        """
+        Run the callbacks of finished background jobs (Tk thread).
+        
+        Reschedules itself every COMPLETION_POLL_MS before running anything,
+        so one failing callback doesn't stop the polling.
+        """
+        self._poll_after = self.root.after(self.COMPLETION_POLL_MS,
+                                           self._poll_completions)
+        while True:
+            try:
+                callback, args = self._completed.get_nowait()
+            except queue.Empty:
+                return
+            callback(*args)
     
     def _setup_window(self) -> None:
         """
@@ -152,25 +353,30 @@ class ImageEditorApp:
         ]
         
         for text, command, color in buttons:
+            dark = self._darken_color(color)
             btn = tk.Button(toolbar, text=text, command=command,
                           bg=color, fg='white', 
                           font=('Segoe UI', 10),
                           relief=tk.FLAT,
                           padx=20, pady=10,
                           cursor='hand2',
-                          activebackground=self._darken_color(color),
+                          activebackground=dark,
                           activeforeground='white',
                           borderwidth=0)
             btn.pack(side=tk.LEFT, padx=2, pady=5)
             
             # Add hover effect
-            btn.bind('<Enter>', lambda e, b=btn, c=color: b.config(bg=self._darken_color(c)))
+            btn.bind('<Enter>', lambda e, b=btn, c=dark: b.config(bg=c))
             btn.bind('<Leave>', lambda e, b=btn, c=color: b.config(bg=c))
     
-    def _darken_color(self, hex_color: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _darken_color(hex_color: str) -> str:
         """
         Darken a hex color for hover effect.
         
+        Memoized, as only a handful of button colors are used.
+        
         Args:
             hex_color (str): Hex color code
             
@@ -251,8 +457,16 @@ class ImageEditorApp:
             canvas.configure(scrollregion=canvas.bbox("all"))
         control_panel.bind("<Configure>", configure_scroll_region)
         
-        # Mouse wheel scrolling
+        # Mouse wheel scrolling. bind_all sees wheel events anywhere in the
+        # window, so only scroll while the pointer is over this panel.
+        panel_path = str(control_panel_container)
         def on_mousewheel(event):
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None:
+                return
+            path = str(widget)
+            if path != panel_path and not path.startswith(panel_path + '.'):
+                return
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind_all("<MouseWheel>", on_mousewheel)
         
@@ -269,33 +483,106 @@ class ImageEditorApp:
         # Separator line
         tk.Frame(control_panel, height=1, bg='#ecf0f1').pack(fill=tk.X)
         
+        # Slider values live in Tk variables so they exist, and can be
+        # reset, before the tab holding the slider has been built
+        self._blur_var = tk.IntVar(value=1)
+        self._brightness_var = tk.IntVar(value=0)
+        self._contrast_var = tk.DoubleVar(value=1.0)
+        self._resize_var = tk.IntVar(value=100)
+        self._blur_var.trace_add('write', self._on_blur_change)
+        self._brightness_var.trace_add('write', self._on_brightness_change)
+        self._contrast_var.trace_add('write', self._on_contrast_change)
+        self._resize_var.trace_add('write', self._on_resize_change)
+        
+        # Text of the value labels shown above each slider
+        self._blur_text = tk.StringVar(value="1")
+        self._brightness_text = tk.StringVar(value="0")
+        self._contrast_text = tk.StringVar(value="1.0")
+        self._resize_text = tk.StringVar(value="100%")
+        
+        # Sections are grouped into tabs; a tab's widgets are only created
+        # the first time it is selected
+        self._control_notebook = ttk.Notebook(control_panel)
+        self._control_notebook.pack(fill=tk.X)
+        self._tab_builders: Dict[str, Any] = {}
+        
+        for text, builder in (("Filters", self._build_filters_tab),
+                              ("Adjust", self._build_adjust_tab),
+                              ("Transform", self._build_transform_tab)):
+            tab = tk.Frame(self._control_notebook, bg='#ffffff')
+            self._control_notebook.add(tab, text=text)
+            self._tab_builders[str(tab)] = partial(builder, tab)
+        
+        self._control_notebook.bind('<<NotebookTabChanged>>',
+                                    self._on_control_tab_changed)
+        # Build the tab that is visible at startup
+        self._on_control_tab_changed()
+        
+        # Apply All Button
+        apply_frame = tk.Frame(control_panel, bg='#ffffff')
+        apply_frame.pack(fill=tk.X, padx=15, pady=20)
+        
+        apply_btn = tk.Button(apply_frame, text="✓ APPLY ALL",
+                             command=self._commit_slider_changes,
+                             bg='#27ae60', fg='white',
+                             font=('Segoe UI', 11, 'bold'),
+                             relief=tk.FLAT,
+                             cursor='hand2',
+                             activebackground='#229954',
+                             activeforeground='white',
+                             height=2,
+                             borderwidth=0)
+        apply_btn.pack(fill=tk.X, pady=5)
+        
+        # Hover effect for apply button
+        apply_btn.bind('<Enter>', lambda e: apply_btn.config(bg='#229954'))
+        apply_btn.bind('<Leave>', lambda e: apply_btn.config(bg='#27ae60'))
+    
+    def _on_control_tab_changed(self, event=None) -> None:
+        """
+        Build the selected control panel tab if it has not been built yet.
+        
+        Args:
+            event: Tkinter event object (unused)
+        """
+        builder = self._tab_builders.pop(self._control_notebook.select(), None)
+        if builder is not None:
+            builder()
+    
+    def _build_filters_tab(self, parent: tk.Frame) -> None:
+        """
+        Build the Filters tab: basic filter buttons and blur slider.
+        
+        Args:
+            parent (tk.Frame): Notebook page to build into
+        """
         # Basic Filters Section
-        self._create_section_header(control_panel, "BASIC FILTERS")
+        self._create_section_header(parent, "BASIC FILTERS")
         
-        basic_frame = tk.Frame(control_panel, bg='#ffffff')
+        basic_frame = tk.Frame(parent, bg='#ffffff')
         basic_frame.pack(fill=tk.X, padx=15, pady=5)
         
         self._create_modern_button(basic_frame, "Grayscale", 
-                                   lambda: self._apply_filter_permanent("grayscale"),
+                                   partial(self._apply_filter_permanent, "grayscale"),
                                    '#7f8c8d')
         self._create_modern_button(basic_frame, "Edge Detection", 
-                                   lambda: self._apply_filter_permanent("edge"),
+                                   partial(self._apply_filter_permanent, "edge"),
                                    '#7f8c8d')
         
         # Blur Section
-        self._create_section_header(control_panel, "BLUR")
+        self._create_section_header(parent, "BLUR")
         
-        blur_frame = tk.Frame(control_panel, bg='#ffffff')
+        blur_frame = tk.Frame(parent, bg='#ffffff')
         blur_frame.pack(fill=tk.X, padx=15, pady=5)
         
-        self.blur_value_label = tk.Label(blur_frame, text="1", 
+        self.blur_value_label = tk.Label(blur_frame, textvariable=self._blur_text, 
                                          font=('Segoe UI', 11),
                                          bg='#ffffff', fg='#34495e')
         self.blur_value_label.pack(pady=(0, 5))
         
         self.blur_slider = tk.Scale(blur_frame, from_=1, to=25,
                                    orient=tk.HORIZONTAL, length=250,
-                                   command=self._on_blur_change,
+                                   variable=self._blur_var,
                                    showvalue=0,
                                    bg='#ffffff', 
                                    troughcolor='#ecf0f1',
@@ -303,25 +590,31 @@ class ImageEditorApp:
                                    sliderrelief=tk.FLAT,
                                    activebackground='#3498db',
                                    borderwidth=0)
-        self.blur_slider.set(1)
         self.blur_slider.pack(pady=5)
         
-        self._create_reset_button(blur_frame, self.blur_slider, 1)
+        self._create_reset_button(blur_frame, self._blur_var, 1)
+    
+    def _build_adjust_tab(self, parent: tk.Frame) -> None:
+        """
+        Build the Adjust tab: brightness and contrast sliders.
         
+        Args:
+            parent (tk.Frame): Notebook page to build into
+        """
         # Brightness Section
-        self._create_section_header(control_panel, "BRIGHTNESS")
+        self._create_section_header(parent, "BRIGHTNESS")
         
-        brightness_frame = tk.Frame(control_panel, bg='#ffffff')
+        brightness_frame = tk.Frame(parent, bg='#ffffff')
         brightness_frame.pack(fill=tk.X, padx=15, pady=5)
         
-        self.brightness_value_label = tk.Label(brightness_frame, text="0",
+        self.brightness_value_label = tk.Label(brightness_frame, textvariable=self._brightness_text,
                                                font=('Segoe UI', 11),
                                                bg='#ffffff', fg='#34495e')
         self.brightness_value_label.pack(pady=(0, 5))
         
         self.brightness_slider = tk.Scale(brightness_frame, from_=-100, to=100,
                                          orient=tk.HORIZONTAL, length=250,
-                                         command=self._on_brightness_change,
+                                         variable=self._brightness_var,
                                          showvalue=0,
                                          bg='#ffffff',
                                          troughcolor='#ecf0f1',
@@ -329,18 +622,17 @@ class ImageEditorApp:
                                          sliderrelief=tk.FLAT,
                                          activebackground='#f39c12',
                                          borderwidth=0)
-        self.brightness_slider.set(0)
         self.brightness_slider.pack(pady=5)
         
-        self._create_reset_button(brightness_frame, self.brightness_slider, 0)
+        self._create_reset_button(brightness_frame, self._brightness_var, 0)
         
         # Contrast Section
-        self._create_section_header(control_panel, "CONTRAST")
+        self._create_section_header(parent, "CONTRAST")
         
-        contrast_frame = tk.Frame(control_panel, bg='#ffffff')
+        contrast_frame = tk.Frame(parent, bg='#ffffff')
         contrast_frame.pack(fill=tk.X, padx=15, pady=5)
         
-        self.contrast_value_label = tk.Label(contrast_frame, text="1.0",
+        self.contrast_value_label = tk.Label(contrast_frame, textvariable=self._contrast_text,
                                              font=('Segoe UI', 11),
                                              bg='#ffffff', fg='#34495e')
         self.contrast_value_label.pack(pady=(0, 5))
@@ -348,7 +640,7 @@ class ImageEditorApp:
         self.contrast_slider = tk.Scale(contrast_frame, from_=0.5, to=3.0,
                                        resolution=0.1, orient=tk.HORIZONTAL,
                                        length=250,
-                                       command=self._on_contrast_change,
+                                       variable=self._contrast_var,
                                        showvalue=0,
                                        bg='#ffffff',
                                        troughcolor='#ecf0f1',
@@ -356,47 +648,53 @@ class ImageEditorApp:
                                        sliderrelief=tk.FLAT,
                                        activebackground='#9b59b6',
                                        borderwidth=0)
-        self.contrast_slider.set(1.0)
         self.contrast_slider.pack(pady=5)
         
-        self._create_reset_button(contrast_frame, self.contrast_slider, 1.0)
+        self._create_reset_button(contrast_frame, self._contrast_var, 1.0)
+    
+    def _build_transform_tab(self, parent: tk.Frame) -> None:
+        """
+        Build the Transform tab: rotate/flip buttons and resize slider.
         
+        Args:
+            parent (tk.Frame): Notebook page to build into
+        """
         # Transform Section
-        self._create_section_header(control_panel, "TRANSFORM")
+        self._create_section_header(parent, "TRANSFORM")
         
-        transform_frame = tk.Frame(control_panel, bg='#ffffff')
+        transform_frame = tk.Frame(parent, bg='#ffffff')
         transform_frame.pack(fill=tk.X, padx=15, pady=5)
         
         self._create_modern_button(transform_frame, "↻ Rotate 90°",
-                                   lambda: self._apply_filter_permanent("rotate", angle=90),
+                                   partial(self._apply_filter_permanent, "rotate", angle=90),
                                    '#16a085')
         self._create_modern_button(transform_frame, "⟲ Rotate 180°",
-                                   lambda: self._apply_filter_permanent("rotate", angle=180),
+                                   partial(self._apply_filter_permanent, "rotate", angle=180),
                                    '#16a085')
         self._create_modern_button(transform_frame, "↺ Rotate 270°",
-                                   lambda: self._apply_filter_permanent("rotate", angle=270),
+                                   partial(self._apply_filter_permanent, "rotate", angle=270),
                                    '#16a085')
         self._create_modern_button(transform_frame, "↔ Flip Horizontal",
-                                   lambda: self._apply_filter_permanent("flip", direction="horizontal"),
+                                   partial(self._apply_filter_permanent, "flip", direction="horizontal"),
                                    '#16a085')
         self._create_modern_button(transform_frame, "↕ Flip Vertical",
-                                   lambda: self._apply_filter_permanent("flip", direction="vertical"),
+                                   partial(self._apply_filter_permanent, "flip", direction="vertical"),
                                    '#16a085')
         
         # Resize Section
-        self._create_section_header(control_panel, "RESIZE")
+        self._create_section_header(parent, "RESIZE")
         
-        resize_frame = tk.Frame(control_panel, bg='#ffffff')
+        resize_frame = tk.Frame(parent, bg='#ffffff')
         resize_frame.pack(fill=tk.X, padx=15, pady=5)
         
-        self.resize_value_label = tk.Label(resize_frame, text="100%",
+        self.resize_value_label = tk.Label(resize_frame, textvariable=self._resize_text,
                                            font=('Segoe UI', 11),
                                            bg='#ffffff', fg='#34495e')
         self.resize_value_label.pack(pady=(0, 5))
         
         self.resize_slider = tk.Scale(resize_frame, from_=25, to=200,
                                      orient=tk.HORIZONTAL, length=250,
-                                     command=self._on_resize_change,
+                                     variable=self._resize_var,
                                      showvalue=0,
                                      bg='#ffffff',
                                      troughcolor='#ecf0f1',
@@ -404,30 +702,9 @@ class ImageEditorApp:
                                      sliderrelief=tk.FLAT,
                                      activebackground='#e74c3c',
                                      borderwidth=0)
-        self.resize_slider.set(100)
         self.resize_slider.pack(pady=5)
         
-        self._create_reset_button(resize_frame, self.resize_slider, 100)
-        
-        # Apply All Button
-        apply_frame = tk.Frame(control_panel, bg='#ffffff')
-        apply_frame.pack(fill=tk.X, padx=15, pady=20)
-        
-        apply_btn = tk.Button(apply_frame, text="✓ APPLY ALL",
-                             command=self._commit_slider_changes,
-                             bg='#27ae60', fg='white',
-                             font=('Segoe UI', 11, 'bold'),
-                             relief=tk.FLAT,
-                             cursor='hand2',
-                             activebackground='#229954',
-                             activeforeground='white',
-                             height=2,
-                             borderwidth=0)
-        apply_btn.pack(fill=tk.X, pady=5)
-        
-        # Hover effect for apply button
-        apply_btn.bind('<Enter>', lambda e: apply_btn.config(bg='#229954'))
-        apply_btn.bind('<Leave>', lambda e: apply_btn.config(bg='#27ae60'))
+        self._create_reset_button(resize_frame, self._resize_var, 100)
     
     def _create_section_header(self, parent, text):
         """Create a modern section header."""
@@ -444,26 +721,27 @@ class ImageEditorApp:
     
     def _create_modern_button(self, parent, text, command, color):
         """Create a modern flat button."""
+        dark = self._darken_color(color)
         btn = tk.Button(parent, text=text,
                        command=command,
                        bg=color, fg='white',
                        font=('Segoe UI', 10),
                        relief=tk.FLAT,
                        cursor='hand2',
-                       activebackground=self._darken_color(color),
+                       activebackground=dark,
                        activeforeground='white',
                        height=2,
                        borderwidth=0)
         btn.pack(fill=tk.X, pady=3)
         
         # Hover effect
-        btn.bind('<Enter>', lambda e: btn.config(bg=self._darken_color(color)))
+        btn.bind('<Enter>', lambda e: btn.config(bg=dark))
         btn.bind('<Leave>', lambda e: btn.config(bg=color))
     
-    def _create_reset_button(self, parent, slider, default_value):
+    def _create_reset_button(self, parent, variable, default_value):
         """Create a small reset button."""
         btn = tk.Button(parent, text="Reset",
-                       command=lambda: self._reset_slider(slider, default_value),
+                       command=partial(self._reset_slider, variable, default_value),
                        bg='#ecf0f1', fg='#34495e',
                        font=('Segoe UI', 9),
                        relief=tk.FLAT,
@@ -495,14 +773,33 @@ class ImageEditorApp:
         
         Demonstrates event binding in Tkinter.
         """
-        self.root.bind("<Control-o>", lambda e: self._open_image())
-        self.root.bind("<Control-s>", lambda e: self._save_image())
-        self.root.bind("<Control-Shift-S>", lambda e: self._save_image_as())
-        self.root.bind("<Control-z>", lambda e: self._undo())
-        self.root.bind("<Control-y>", lambda e: self._redo())
-        self.root.bind("<Control-q>", lambda e: self._exit_application())
-        self.root.bind("<Control-plus>", lambda e: self._zoom_in())
-        self.root.bind("<Control-minus>", lambda e: self._zoom_out())
+        shortcuts = (
+            ("<Control-o>", self._open_image),
+            ("<Control-s>", self._save_image),
+            ("<Control-Shift-S>", self._save_image_as),
+            ("<Control-z>", self._undo),
+            ("<Control-y>", self._redo),
+            ("<Control-q>", self._exit_application),
+            ("<Control-plus>", self._zoom_in),
+            ("<Control-minus>", self._zoom_out),
+        )
+        for sequence, command in shortcuts:
+            self.root.bind(sequence, self._ignore_event(command))
+    
+    @staticmethod
+    def _ignore_event(command):
+        """
+        Adapt a no-argument command to a Tk event handler.
+        
+        Args:
+            command: Callable taking no arguments
+            
+        Returns:
+            Callable that accepts (and drops) the event Tk passes in
+        """
+        def handler(event=None):
+            return command()
+        return handler
     
     def _open_image(self) -> None:
         """
@@ -522,35 +819,108 @@ class ImageEditorApp:
                                              filetypes=filetypes)
         
         if filepath:
-            try:
-                # Create Image object (class interaction)
-                self._image = Image(filepath)
-                self._filter_manager.current_image = self._image
-                
-                # Store original for slider adjustments
-                self._original_for_sliders = self._image.current_image.copy()
-                
-                # Reset sliders to default
-                self.blur_slider.set(1)
-                self.brightness_slider.set(0)
-                self.contrast_slider.set(1.0)
-                self.resize_slider.set(100)
-                
-                # Display the image first
+            load_scale = self._choose_load_scale(filepath)
+            if load_scale is None:
+                return
+            
+            # Decode on the I/O thread so large files don't freeze the GUI
+            self._update_status(f"Opening: {filepath}")
+            future = self._io_pool.submit(Image, filepath, load_scale)
+            self._pending_open = future
+            self._when_done(future, self._finish_open, filepath)
+    
+    def _choose_load_scale(self, filepath: str) -> Optional[int]:
+        """
+        Pick the decode reduction for a file from its header alone.
+        
+        PIL only parses the header on open, so the dimensions are known
+        before committing to a full decode. Very large images ask the user
+        whether to load them at reduced resolution.
+        
+        Args:
+            filepath (str): Path of the file about to be opened
+            
+        Returns:
+            Optional[int]: Load scale for Image (1, 2, 4 or 8), or None if
+            the user cancelled
+        """
+        try:
+            with PILImage.open(filepath) as probe:
+                width, height = probe.size
+        except PILImage.DecompressionBombError:
+            # Too large for PIL to even report; use the strongest reduction
+            width = height = None
+        except Exception:
+            # Let the full decode report unreadable files
+            return 1
+        
+        if width is None:
+            scale = 8
+            size_text = "This image is extremely large."
+        else:
+            scale = 1
+            while scale < 8 and width * height > self.MAX_OPEN_PIXELS * scale * scale:
+                scale *= 2
+            if scale == 1:
+                return 1
+            size_text = (f"This image is {width}x{height} pixels. Opening it at "
+                         f"1/{scale} size ({width // scale}x{height // scale}) "
+                         f"keeps editing responsive.")
+        
+        answer = messagebox.askyesnocancel(
+            "Large Image",
+            f"{size_text}\n\nOpen at reduced resolution?\n"
+            f"Choose No to load the full image.")
+        if answer is None:
+            return None
+        return scale if answer else 1
+    
+    def _finish_open(self, future: Future, filepath: str) -> None:
+        """
+        Show an image once the background load started by _open_image is done.
+        
+        Runs on the Tk thread (scheduled via root.after).
+        
+        Args:
+            future (Future): Future resolving to the loaded Image object
+            filepath (str): Path of the opened file
+        """
+        if future is not self._pending_open:
+            return  # Superseded by a newer open request
+        self._pending_open = None
+        
+        try:
+            # Create Image object (class interaction)
+            self._image = future.result()
+            self._filter_manager.current_image = self._image
+            self._invalidate_display_cache()
+            
+            # A filter still running belongs to the previous image
+            self._pending_filter = None
+            
+            # Sliders start from the new image, at their defaults
+            self._rebase_sliders()
+            
+            # Force window update to get accurate canvas dimensions
+            self.root.update_idletasks()
+            
+            if self.canvas.winfo_width() > 1:
+                # Canvas already has its real size: fit (and draw) right away
+                self._fit_to_window()
+            else:
+                # Canvas not laid out yet; fit once it reports its size
                 self._display_current_image()
-                
-                # Force window update to get accurate canvas dimensions
-                self.root.update_idletasks()
-                
-                # Small delay to ensure canvas is fully rendered
-                self.root.after(100, self._fit_to_window)
-                
-                # Update status bar
-                filename = filepath.split('/')[-1]
-                self._update_status(f"Opened: {filename}")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open image: {str(e)}")
+                if self._fit_binding is None:
+                    self._fit_binding = self.canvas.bind('<Configure>',
+                                                         self._on_first_configure,
+                                                         add='+')
+            
+            # Update status bar
+            self._filename = os.path.basename(filepath)
+            self._update_status(f"Opened: {self._filename}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open image: {str(e)}")
     
     def _save_image(self) -> None:
         """
@@ -560,12 +930,17 @@ class ImageEditorApp:
             messagebox.showwarning("Warning", "No image to save")
             return
         
-        try:
-            cv2.imwrite(self._image.filepath, self._image.current_image)
-            self._update_status(f"Saved: {self._image.filepath}")
-            messagebox.showinfo("Success", "Image saved successfully")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save image: {str(e)}")
+        if self._image.load_scale != 1:
+            # Writing a reduced decode back would replace the full-resolution
+            # original with a smaller copy
+            messagebox.showwarning(
+                "Reduced Resolution",
+                f"This image was opened at 1/{self._image.load_scale} size. "
+                f"Save it under a new name to keep the full-resolution original.")
+            self._save_image_as()
+            return
+        
+        self._write_image(self._image.filepath, f"Saved: {self._image.filepath}")
     
     def _save_image_as(self) -> None:
         """
@@ -589,12 +964,66 @@ class ImageEditorApp:
                                                defaultextension=".jpg")
         
         if filepath:
-            try:
-                cv2.imwrite(filepath, self._image.current_image)
-                self._update_status(f"Saved as: {filepath}")
-                messagebox.showinfo("Success", "Image saved successfully")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save image: {str(e)}")
+            self._write_image(filepath, f"Saved as: {filepath}")
+    
+    def _write_image(self, filepath: str, message: str) -> None:
+        """
+        Encode and write the current image on the I/O thread.
+        
+        Args:
+            filepath (str): Destination path
+            message (str): Status bar message shown once the file is written
+        """
+        extension = os.path.splitext(filepath)[1].lower()
+        params = self.SAVE_PARAMS.get(extension, [])
+        
+        # Render the slider adjustments at full resolution on the worker
+        # too. current_image is read-only and edits replace it, so later
+        # edits can't race the encoder
+        source, operations = self._slider_source()
+        
+        future = self._io_pool.submit(self._render_and_write, filepath,
+                                      source, operations, params)
+        self._update_status(f"Saving: {filepath}")
+        self._when_done(future, self._finish_save, message)
+    
+    def _render_and_write(self, filepath: str, image: np.ndarray,
+                          operations: List[Tuple[str, Dict[str, Any]]],
+                          params: List[int]) -> bool:
+        """
+        Apply pending operations and encode the result (I/O thread).
+        
+        Args:
+            filepath (str): Destination path
+            image (numpy.ndarray): Image to save, before operations
+            operations (list): (filter_key, kwargs) pairs still to apply
+            params (list): cv2.imwrite encoder parameters
+            
+        Returns:
+            bool: The cv2.imwrite result
+        """
+        image = self._filter_manager.run_pipeline(image, operations)
+        if image.ndim == 2:
+            # Single-channel results (edge maps) are saved in colour like
+            # every other edit; only here is the plane replicated
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        return cv2.imwrite(filepath, image, params)
+    
+    def _finish_save(self, future: Future, message: str) -> None:
+        """
+        Report the result of a background save started by _write_image.
+        
+        Args:
+            future (Future): Future resolving to the cv2.imwrite result
+            message (str): Status bar message for a successful save
+        """
+        try:
+            if not future.result():
+                raise IOError("OpenCV could not write the file")
+            self._update_status(message)
+            messagebox.showinfo("Success", "Image saved successfully")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save image: {str(e)}")
     
     def _apply_filter_permanent(self, filter_key: str, **kwargs) -> None:
         """
@@ -610,178 +1039,479 @@ class ImageEditorApp:
             messagebox.showwarning("Warning", "Please open an image first")
             return
         
-        # Apply filter using FilterManager (class interaction)
-        success = self._filter_manager.apply_filter(filter_key, **kwargs)
+        if self._filter_busy():
+            return
         
-        if success:
-            # Update original for sliders with the new permanent change
-            self._original_for_sliders = self._image.current_image.copy()
-            
-            # Reset sliders after permanent change
-            self.blur_slider.set(1)
-            self.brightness_slider.set(0)
-            self.contrast_slider.set(1.0)
-            self.resize_slider.set(100)
+        # Bake the slider adjustments in so the filter applies on top of them
+        source, adjustments = self._slider_source()
+        operations = [(filter_key, kwargs)]
+        
+        filter_info = self._filter_manager.get_filter_info(filter_key)
+        name = filter_info['name'] if filter_info else filter_key
+        self._start_permanent_filter(source, adjustments, operations,
+                                     "filter", f"Applied: {name}")
+    
+    def _filter_busy(self) -> bool:
+        """
+        Check whether a permanent filter is still being computed.
+        
+        Actions that change the image are refused meanwhile (with a status
+        message), so they can neither drop the filter nor be overwritten
+        by it when it finishes.
+        
+        Returns:
+            bool: True if the caller should not go ahead
+        """
+        if self._pending_filter is None:
+            return False
+        self._update_status("Still applying the previous filter...")
+        return True
+    
+    def _start_permanent_filter(self, source: np.ndarray,
+                                adjustments: List[Tuple[str, Dict[str, Any]]],
+                                operations: List[Tuple[str, Dict[str, Any]]],
+                                what: str, message: str,
+                                announce: bool = False) -> None:
+        """
+        Run a permanent change on the filter worker.
+        
+        Large images would otherwise freeze the GUI while filtering.
+        
+        Args:
+            source (numpy.ndarray): Image to start from
+            adjustments (list): Slider operations to bake in first
+            operations (list): (filter_key, kwargs) pairs to record as the step
+            what (str): What is being applied, for status and error messages
+            message (str): Status bar message once it is done
+            announce (bool): Also confirm success in a message box
+        """
+        future = self._filter_pool.submit(self._run_permanent_filter, source,
+                                          adjustments, operations)
+        self._pending_filter = future
+        self._update_status(f"Applying {what}...")
+        self._when_done(future, self._finish_filter, operations, what, message,
+                        announce)
+    
+    def _run_permanent_filter(self, source: np.ndarray,
+                              adjustments: List[Tuple[str, Dict[str, Any]]],
+                              operations: List[Tuple[str, Dict[str, Any]]]
+                              ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute a permanent filter (filter worker thread).
+        
+        Args:
+            source (numpy.ndarray): Image the user is editing
+            adjustments (list): Previewed slider operations to bake in first
+            operations (list): (filter_key, kwargs) pairs of the filter itself
             
-            self._display_current_image()
-            filter_info = self._filter_manager.get_filter_info(filter_key)
-            if filter_info:
-                self._update_status(f"Applied: {filter_info['name']}")
-        else:
-            messagebox.showerror("Error", "Failed to apply filter")
+        Returns:
+            tuple: (image the filter was applied to, filtered image)
+        """
+        base = self._filter_manager.run_pipeline(source, adjustments)
+        return base, self._filter_manager.run_pipeline(base, operations)
     
-    def _on_blur_change(self, value) -> None:
+    def _finish_filter(self, future: Future,
+                       operations: List[Tuple[str, Dict[str, Any]]],
+                       what: str, message: str, announce: bool) -> None:
         """
-        Real-time blur adjustment as slider moves.
+        Show a change started by _start_permanent_filter once it is done.
+        
+        Runs on the Tk thread (scheduled via root.after).
         
         Args:
-            value: Slider value (automatically passed by Tkinter)
+            future (Future): Future resolving to _run_permanent_filter's result
+            operations (list): (filter_key, kwargs) pairs that were applied
+            what (str): What was applied, for the error message
+            message (str): Status bar message on success
+            announce (bool): Also confirm success in a message box
         """
-        if self._image is None or self._original_for_sliders is None:
+        if future is not self._pending_filter:
+            return  # The image was replaced while the filter was running
+        self._pending_filter = None
+        
+        try:
+            base, processed = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to apply {what}: {e}")
+            self._update_status(f"Failed to apply {what}")
             return
         
-        intensity = int(float(value))
-        # Ensure odd number for kernel size
-        if intensity % 2 == 0:
-            intensity += 1
+        # Record it in FilterManager (class interaction); undo returns to
+        # base, which includes any slider adjustments baked in above
+        self._filter_manager.record_result(base, processed, operations)
+        # Pack the older undo steps off the Tk thread, like saves
+        self._io_pool.submit(self._filter_manager.compress_history)
+        self._invalidate_display_cache()
+        
+        # Sliders start afresh from the new permanent change
+        self._rebase_sliders()
+        
+        self._display_current_image()
+        self._update_status(message)
+        if announce:
+            messagebox.showinfo("Success", "All adjustments have been applied!")
+    
+    def _on_blur_change(self, *args) -> None:
+        """
+        Real-time blur adjustment as slider moves.
+        
+        Args:
+            *args: Variable name, index and mode passed by the trace
+        """
+        if self._original_for_sliders is None:
+            return  # No image loaded yet
+        
+        intensity = self._blur_var.get()
         
         # Update label - just the value
-        self.blur_value_label.config(text=f"{int(float(value))}")
+        self._blur_text.set(f"{intensity}")
         
-        # Apply filter to original image (not cumulative)
-        try:
-            # Get the filter
-            blur_filter = self._filter_manager.get_filter("blur")
-            
-            # Apply to original
-            filtered = blur_filter.apply(self._original_for_sliders, intensity=intensity)
-            
-            # Update display only (not permanent)
-            self._image.current_image = filtered
-            self._display_current_image()
-            
-        except Exception as e:
-            print(f"Error applying blur: {e}")
+        # Even sizes are rounded up to the next odd kernel, so e.g. 2 and 3
+        # blur the same
+        if intensity % 2 == 0:
+            intensity += 1
+        if intensity == self._last_blur:
+            return
+        self._last_blur = intensity
+        
+        self._schedule_slider_update()
     
-    def _on_brightness_change(self, value) -> None:
+    def _on_brightness_change(self, *args) -> None:
         """
         Real-time brightness adjustment as slider moves.
         
         Args:
-            value: Slider value (automatically passed by Tkinter)
+            *args: Variable name, index and mode passed by the trace
         """
-        if self._image is None or self._original_for_sliders is None:
-            return
+        if self._original_for_sliders is None:
+            return  # No image loaded yet
         
-        brightness_value = int(float(value))
+        brightness_value = self._brightness_var.get()
         
         # Update label - just the value
-        self.brightness_value_label.config(text=f"{brightness_value}")
+        self._brightness_text.set(f"{brightness_value}")
         
-        # Apply filter to original image
-        try:
-            brightness_filter = self._filter_manager.get_filter("brightness")
-            filtered = brightness_filter.apply(self._original_for_sliders, value=brightness_value)
-            
-            # Update display only
-            self._image.current_image = filtered
-            self._display_current_image()
-            
-        except Exception as e:
-            print(f"Error applying brightness: {e}")
+        if brightness_value == self._last_brightness:
+            return
+        self._last_brightness = brightness_value
+        
+        self._schedule_slider_update()
     
-    def _on_contrast_change(self, value) -> None:
+    def _on_contrast_change(self, *args) -> None:
         """
         Real-time contrast adjustment as slider moves.
         
         Args:
-            value: Slider value (automatically passed by Tkinter)
+            *args: Variable name, index and mode passed by the trace
         """
-        if self._image is None or self._original_for_sliders is None:
-            return
+        if self._original_for_sliders is None:
+            return  # No image loaded yet
         
-        contrast_value = float(value)
+        contrast_value = round(self._contrast_var.get(), 1)
         
         # Update label - just the value
-        self.contrast_value_label.config(text=f"{contrast_value:.1f}")
+        self._contrast_text.set(f"{contrast_value:.1f}")
         
-        # Apply filter to original image
-        try:
-            contrast_filter = self._filter_manager.get_filter("contrast")
-            filtered = contrast_filter.apply(self._original_for_sliders, value=contrast_value)
-            
-            # Update display only
-            self._image.current_image = filtered
-            self._display_current_image()
-            
-        except Exception as e:
-            print(f"Error applying contrast: {e}")
+        if contrast_value == self._last_contrast:
+            return
+        self._last_contrast = contrast_value
+        
+        self._schedule_slider_update()
     
-    def _on_resize_change(self, value) -> None:
+    def _on_resize_change(self, *args) -> None:
         """
         Real-time resize adjustment as slider moves.
         
         Args:
-            value: Slider value (automatically passed by Tkinter)
+            *args: Variable name, index and mode passed by the trace
         """
-        if self._image is None or self._original_for_sliders is None:
-            return
+        if self._original_for_sliders is None:
+            return  # No image loaded yet
         
-        scale_percent = int(float(value))
-        scale = scale_percent / 100.0
+        scale_percent = self._resize_var.get()
         
         # Update label
-        self.resize_value_label.config(text=f"Scale: {scale_percent}%")
+        self._resize_text.set(f"Scale: {scale_percent}%")
         
-        # Apply filter to original image
-        try:
-            resize_filter = self._filter_manager.get_filter("resize")
-            filtered = resize_filter.apply(self._original_for_sliders, scale=scale)
-            
-            # Update display only
-            self._image.current_image = filtered
+        if scale_percent == self._last_resize:
+            return
+        # Reject out-of-range scales up front instead of failing in the worker
+        if not FilterManager.validate_filter_params("resize", scale=scale_percent / 100.0):
+            self._update_status(f"Invalid resize scale: {scale_percent}%")
+            return
+        self._last_resize = scale_percent
+        
+        self._schedule_slider_update()
+    
+    def _schedule_slider_update(self) -> None:
+        """
+        Coalesce slider events so only the latest values are processed.
+        
+        Tkinter calls the slider command for every step of a drag. Instead of
+        filtering the full image each time, the work is deferred briefly and
+        any still-pending update is cancelled, so a fast drag runs the
+        filters once per SLIDER_DELAY_MS.
+        """
+        if self._pending_after is not None:
+            self.root.after_cancel(self._pending_after)
+        self._pending_after = self.root.after(self.SLIDER_DELAY_MS,
+                                              self._run_slider_update)
+    
+    def _reset_sliders(self) -> None:
+        """
+        Put every slider back to its default after the image changed.
+        
+        The callers have already dropped the preview and redraw the new
+        image themselves, so the slider update the reset schedules (and any
+        left over from a drag) is cancelled instead of redrawing again.
+        """
+        self._blur_var.set(1)
+        self._brightness_var.set(0)
+        self._contrast_var.set(1.0)
+        self._resize_var.set(100)
+        
+        if self._pending_after is not None:
+            self.root.after_cancel(self._pending_after)
+            self._pending_after = None
+    
+    def _run_slider_update(self) -> None:
+        """Run a deferred slider update scheduled by _schedule_slider_update."""
+        self._pending_after = None
+        self._preview_sliders()
+    
+    def _slider_operations(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Build the filter pipeline described by the current slider positions.
+        
+        Sliders left at their default value are skipped.
+        
+        Returns:
+            list: (filter_key, kwargs) pairs in blur, brightness, contrast,
+            resize order
+        """
+        operations = []
+        
+        intensity = self._blur_var.get()
+        # Ensure odd number for kernel size
+        if intensity % 2 == 0:
+            intensity += 1
+        if intensity > 1:
+            operations.append(("blur", {"intensity": intensity}))
+        
+        brightness_value = self._brightness_var.get()
+        if brightness_value != 0:
+            operations.append(("brightness", {"value": brightness_value}))
+        
+        contrast_value = round(self._contrast_var.get(), 1)
+        if contrast_value != 1.0:
+            operations.append(("contrast", {"value": contrast_value}))
+        
+        scale_percent = self._resize_var.get()
+        if scale_percent != 100:
+            resize_kwargs = {"scale": scale_percent / 100.0}
+            if scale_percent > 100:
+                # Final-quality enlargement; previews swap in INTER_NEAREST
+                resize_kwargs["interpolation"] = cv2.INTER_CUBIC
+            operations.append(("resize", resize_kwargs))
+        
+        return operations
+    
+    def _preview_sliders(self) -> None:
+        """
+        Preview all slider adjustments on the image.
+        
+        The adjustments are always applied to the stored original (not
+        cumulative), combined into one pipeline so moving one slider keeps
+        the effect of the others. They run on a proxy no larger than
+        PREVIEW_MAX_SIZE; the full-resolution pass only happens on commit.
+        
+        The filters run on _preview_pool so the Tk thread stays responsive;
+        _on_preview_ready shows the result unless a newer preview has been
+        requested in the meantime.
+        """
+        operations = self._slider_operations()
+        self._preview_seq += 1
+        
+        if not operations:
+            self._preview = None
+            self._invalidate_display_cache()
             self._display_current_image()
+            return
+        
+        source = self._preview_source()
+        proxy_scale = source.shape[1] / self._original_for_sliders.shape[1]
+        
+        # Size the adjusted image will have at full resolution
+        height, width = self._original_for_sliders.shape[:2]
+        scale = self._resize_var.get() / 100.0
+        full_size = (int(width * scale), int(height * scale))
+        
+        seq = self._preview_seq
+        future = self._preview_pool.submit(
+            self._compute_preview, seq, source,
+            self._scale_operations(operations, proxy_scale), self._stage_cache)
+        self._when_done(future, self._on_preview_ready, seq, full_size)
+    
+    def _compute_preview(self, seq: int, source: np.ndarray,
+                         operations: List[Tuple[str, Dict[str, Any]]],
+                         stage_cache: Dict[tuple, np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Run the slider pipeline on the preview proxy (worker thread).
+        
+        Args:
+            seq (int): Preview request number
+            source (numpy.ndarray): Preview proxy to filter
+            operations (list): (filter_key, kwargs) pairs scaled to the proxy
+            stage_cache (dict): Stage cache belonging to this proxy
             
+        Returns:
+            numpy.ndarray or None: Filtered proxy, or None if the request was
+            superseded before it started
+        """
+        if seq != self._preview_seq:
+            return None  # Drop stale frames queued behind a slow one
+        # Stages before the slider that moved come from the cache
+        return self._filter_manager.run_pipeline(source, operations, stage_cache)
+    
+    def _on_preview_ready(self, future: Future, seq: int,
+                          full_size: Tuple[int, int]) -> None:
+        """
+        Show a preview computed by _compute_preview (Tk thread).
+        
+        Args:
+            future (Future): Future resolving to the filtered proxy
+            seq (int): Preview request number the future belongs to
+            full_size (tuple): Full-resolution (width, height) of the result
+        """
+        if seq != self._preview_seq:
+            return  # A newer preview was requested or the image changed
+        
+        try:
+            filtered = future.result()
         except Exception as e:
-            print(f"Error applying resize: {e}")
+            self._update_status(f"Preview failed: {e}")
+            return
+        
+        # Update display only (not permanent), with the cheap scaling used
+        # while dragging; the committed image is redrawn at full quality
+        self._preview = (filtered, full_size)
+        self._invalidate_display_cache()
+        self._redraw_fast()
+    
+    def _discard_preview(self) -> None:
+        """
+        Drop the slider preview, including one still being computed.
+        """
+        self._preview = None
+        self._preview_seq += 1
     
-    def _reset_slider(self, slider, default_value) -> None:
+    def _preview_source(self) -> np.ndarray:
+        """
+        Get the downscaled copy of _original_for_sliders used for previews.
+        
+        The proxy only needs the detail shown at the current zoom level,
+        so when zoomed out it is shrunk further than PREVIEW_MAX_SIZE. It
+        is rebuilt (dropping the stage cache that belongs to it) when a
+        zoom change leaves it too coarse, or more than twice too large.
+        
+        Returns:
+            numpy.ndarray: Original shrunk to at most PREVIEW_MAX_SIZE pixels
+            on the long edge (the original itself if already that small)
+        """
+        original = self._original_for_sliders
+        long_edge = max(original.shape[:2])
+        needed = min(self.PREVIEW_MAX_SIZE, long_edge * self._zoom_level)
+        
+        if self._preview_src is not None:
+            size = max(self._preview_src.shape[:2])
+            if size < min(needed, long_edge) or size > 2 * needed:
+                self._preview_src = None
+                self._stage_cache = {}
+        
+        if self._preview_src is None:
+            scale = needed / long_edge
+            if scale >= 1.0:
+                self._preview_src = original
+            else:
+                # Explicit size so a very thin image keeps at least one pixel
+                size = (max(1, round(original.shape[1] * scale)),
+                        max(1, round(original.shape[0] * scale)))
+                self._preview_src = cv2.resize(original, size,
+                                               interpolation=cv2.INTER_AREA)
+        return self._preview_src
+    
+    @staticmethod
+    def _scale_operations(operations: List[Tuple[str, Dict[str, Any]]],
+                          scale: float) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Adapt slider operations to the preview proxy.
+        
+        The blur kernel is shrunk by the proxy scale so the preview looks
+        like the full-resolution result, and large kernels use the fast
+        approximate blur. The resize uses nearest-neighbour sampling.
+        Commits still use the exact Gaussian and INTER_AREA/INTER_CUBIC.
+        
+        Args:
+            operations (list): (filter_key, kwargs) pairs for the full image
+            scale (float): Proxy width divided by full-resolution width
+            
+        Returns:
+            list: (filter_key, kwargs) pairs for the proxy image
+        """
+        scaled = []
+        for filter_key, kwargs in operations:
+            if filter_key == "blur":
+                # Keep the kernel size odd
+                intensity = int(kwargs["intensity"] * min(scale, 1.0)) | 1
+                if intensity <= 1:
+                    continue
+                kwargs = {"intensity": intensity, "approximate": True}
+            elif filter_key == "resize":
+                kwargs = dict(kwargs, interpolation=cv2.INTER_NEAREST)
+            scaled.append((filter_key, kwargs))
+        return scaled
+    
+    def _reset_slider(self, variable, default_value) -> None:
         """
         Reset a slider to its default value.
         
         Args:
-            slider: The slider widget to reset
+            variable: The Tk variable bound to the slider
             default_value: The default value to set
         """
         if self._image is None:
             return
         
-        slider.set(default_value)
-        # The slider's command will automatically trigger and reset the image
+        variable.set(default_value)
+        # The variable's trace will automatically trigger and reset the image
     
     def _commit_slider_changes(self) -> None:
         """
         Make the current slider adjustments permanent.
         This updates the original so sliders start fresh.
         """
-        if self._image is None:
+        if self._image is None or self._filter_busy():
             return
         
-        # Update the stored original to current state
-        self._original_for_sliders = self._image.current_image.copy()
+        source, operations = self._slider_source()
+        if operations:
+            # Re-run the adjustments at full resolution from the unadjusted
+            # image on the filter worker; _finish_filter records them as a
+            # single undoable step and starts the sliders afresh
+            self._start_permanent_filter(source, [], operations,
+                                         "adjustments", "Adjustments applied permanently",
+                                         announce=True)
+            return
         
-        # Reset sliders to default
-        self.blur_slider.set(1)
-        self.brightness_slider.set(0)
-        self.contrast_slider.set(1.0)
-        self.resize_slider.set(100)
+        # Nothing to bake in; just start the sliders afresh
+        self._rebase_sliders()
         
         self._update_status("Adjustments applied permanently")
         messagebox.showinfo("Success", "All adjustments have been applied!")
     
     def _apply_blur(self) -> None:
         """Apply blur filter with slider value (legacy - kept for compatibility)."""
-        intensity = self.blur_slider.get()
+        intensity = self._blur_var.get()
         # Ensure odd number for kernel size
         if intensity % 2 == 0:
             intensity += 1
@@ -789,17 +1519,17 @@ class ImageEditorApp:
     
     def _apply_brightness(self) -> None:
         """Apply brightness adjustment with slider value (legacy)."""
-        value = self.brightness_slider.get()
+        value = self._brightness_var.get()
         self._apply_filter_permanent("brightness", value=value)
     
     def _apply_contrast(self) -> None:
         """Apply contrast adjustment with slider value (legacy)."""
-        value = self.contrast_slider.get()
+        value = self._contrast_var.get()
         self._apply_filter_permanent("contrast", value=value)
     
     def _apply_resize(self) -> None:
         """Apply resize with slider value (legacy)."""
-        scale = self.resize_slider.get() / 100.0
+        scale = self._resize_var.get() / 100.0
         self._apply_filter_permanent("resize", scale=scale)
     
     def _undo(self) -> None:
@@ -808,7 +1538,13 @@ class ImageEditorApp:
         
         Demonstrates method interaction with FilterManager.
         """
+        if self._filter_busy():
+            return
         if self._filter_manager.undo():
+            self._io_pool.submit(self._filter_manager.compress_history)
+            self._invalidate_display_cache()
+            # The sliders now start from the restored image
+            self._rebase_sliders()
             self._display_current_image()
             self._update_status("Undo performed")
         else:
@@ -818,43 +1554,146 @@ class ImageEditorApp:
         """
         Redo the last undone operation.
         """
+        if self._filter_busy():
+            return
         if self._filter_manager.redo():
+            self._io_pool.submit(self._filter_manager.compress_history)
+            self._invalidate_display_cache()
+            # The sliders now start from the restored image
+            self._rebase_sliders()
             self._display_current_image()
             self._update_status("Redo performed")
         else:
             messagebox.showinfo("Info", "Nothing to redo")
     
+    def _rebase_sliders(self) -> None:
+        """
+        Make the current image the slider baseline and reset the sliders.
+        
+        Must follow every change to the current image (open, filters,
+        undo/redo, reset); the sliders describe adjustments of
+        _original_for_sliders.
+        """
+        self._original_for_sliders = self._image.current_image
+        self._preview_src = None
+        self._stage_cache = {}
+        self._discard_preview()
+        self._reset_sliders()
+    
+    def _slider_source(self) -> Tuple[np.ndarray, List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Get the image a save or filter starts from and the slider operations
+        to apply to it first.
+        
+        The image always comes from the FilterManager's state. The slider
+        operations are only used while _original_for_sliders is that same
+        image; if some change skipped _rebase_sliders, the sliders describe
+        an image no longer being edited and are reset instead of being
+        applied to the wrong base. The decision uses the slider values, not
+        whether their preview has arrived yet.
+        
+        Returns:
+            tuple: (current image, slider operations to apply to it)
+        """
+        current = self._image.current_image
+        if self._original_for_sliders is not current:
+            self._rebase_sliders()
+            self._display_current_image()
+            return current, []
+        return current, self._slider_operations()
+    
     def _reset_to_original(self) -> None:
         """Reset image to original state and reset all sliders."""
         if self._image is None:
             messagebox.showwarning("Warning", "No image loaded")
             return
+        if self._filter_busy():
+            return
         
         self._image.reset_to_original()
+        self._invalidate_display_cache()
         
-        # Update original for sliders
-        self._original_for_sliders = self._image.current_image.copy()
-        
-        # Reset all sliders
-        self.blur_slider.set(1)
-        self.brightness_slider.set(0)
-        self.contrast_slider.set(1.0)
-        self.resize_slider.set(100)
+        # Sliders start from the original, at their defaults
+        self._rebase_sliders()
         
         self._display_current_image()
         self._update_status("Reset to original image")
     
     def _zoom_in(self) -> None:
-        """Zoom in on the image."""
-        self._zoom_level *= 1.2
-        self._display_current_image()
-        self._update_status(f"Zoom: {int(self._zoom_level * 100)}%")
+        """Zoom in on the image to the next larger zoom step."""
+        # First step above the current level (which may be a fit-to-window value)
+        index = bisect.bisect_right(self.ZOOM_STEPS, self._zoom_level)
+        if index < len(self.ZOOM_STEPS):
+            self._set_zoom(self.ZOOM_STEPS[index])
     
     def _zoom_out(self) -> None:
-        """Zoom out on the image."""
-        self._zoom_level /= 1.2
+        """Zoom out on the image to the next smaller zoom step."""
+        # Last step below the current level
+        index = bisect.bisect_left(self.ZOOM_STEPS, self._zoom_level) - 1
+        if index >= 0:
+            self._set_zoom(self.ZOOM_STEPS[index])
+    
+    def _set_zoom(self, zoom_level: float) -> None:
+        """
+        Change the zoom level and redraw the image.
+        
+        Args:
+            zoom_level (float): New zoom level (1.0 = 100%)
+        """
+        self._zoom_level = zoom_level
+        self._schedule_redraw()
+        self._update_status(f"Zoom: {round(self._zoom_level * 100)}%")
+    
+    def _schedule_redraw(self) -> None:
+        """
+        Redraw once Tk is idle, collapsing repeated requests into one.
+        
+        Holding Ctrl++ fires zoom events faster than the canvas can repaint;
+        only the last zoom level of a burst is rendered.
+        """
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+    
+    def _do_redraw(self) -> None:
+        """Perform the redraw requested by _schedule_redraw."""
+        self._redraw_pending = False
+        self._redraw_fast()
+    
+    def _redraw_fast(self) -> None:
+        """
+        Redraw using the cheap nearest-neighbour preview scaling.
+        
+        A full-quality redraw follows once no further fast redraw has been
+        requested for SETTLE_DELAY_MS, so the view doesn't stay aliased.
+        """
+        self._fast_preview = True
+        try:
+            self._display_current_image()
+        finally:
+            self._fast_preview = False
+        
+        if self._settle_after is not None:
+            self.root.after_cancel(self._settle_after)
+        self._settle_after = self.root.after(self.SETTLE_DELAY_MS,
+                                             self._settle_redraw)
+    
+    def _settle_redraw(self) -> None:
+        """Redraw at full quality once fast redraws have stopped."""
+        self._settle_after = None
         self._display_current_image()
-        self._update_status(f"Zoom: {int(self._zoom_level * 100)}%")
+    
+    def _on_first_configure(self, event) -> None:
+        """
+        Fit the image once the canvas reports its real size, then unbind.
+        
+        Args:
+            event: Tkinter <Configure> event
+        """
+        self.canvas.unbind('<Configure>', self._fit_binding)
+        self._fit_binding = None
+        self._fit_to_window()
     
     def _fit_to_window(self) -> None:
         """Fit image to window size."""
@@ -865,8 +1704,9 @@ class ImageEditorApp:
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
-        width_ratio = canvas_width / self._image.width
-        height_ratio = canvas_height / self._image.height
+        image_width, image_height = self._display_dimensions()
+        width_ratio = canvas_width / image_width
+        height_ratio = canvas_height / image_height
         
         self._zoom_level = min(width_ratio, height_ratio) * 0.95
         self._display_current_image()
@@ -881,30 +1721,362 @@ class ImageEditorApp:
         if self._image is None:
             return
         
-        # Get current image from Image object
-        img_bgr = self._image.current_image
+        if not self._fast_preview and self._settle_after is not None:
+            # This redraw is already full quality
+            self.root.after_cancel(self._settle_after)
+            self._settle_after = None
+        
+        interpolation = self._display_interpolation()
+        key = (self._image_version, self._zoom_level, interpolation)
+        
+        photo = self._photo_cache.get(key)
+        if photo is not None:
+            # Same pixels at the same zoom - reuse the existing PhotoImage
+            self._photo_cache.move_to_end(key)
+            if photo is self._display_image:
+                return  # Already on the canvas; nothing to hand to Tk
+        else:
+            img_rgb = self._render_display_image(interpolation)
+            height, width = img_rgb.shape[:2]
+            
+            if width * height <= self.PPM_MAX_PIXELS:
+                # Small images go straight to Tk as binary PPM, skipping
+                # the PIL image and ImageTk wrapper. Concatenating the
+                # header with a view of the pixels copies them only once.
+                pixels = memoryview(np.ascontiguousarray(img_rgb)).cast('B')
+                data = b'P6\n%d %d\n255\n' % (width, height) + pixels
+                photo = self._reusable_display_photo(tk.PhotoImage, width, height)
+                if photo is not None:
+                    photo.configure(data=data, format='PPM')
+                else:
+                    photo = tk.PhotoImage(master=self.root, format='PPM', data=data)
+            else:
+                # Wrap the pixels in a PIL Image without copying them.
+                # frombuffer needs a C-contiguous buffer but skips
+                # fromarray's stride probing. (A 'BGR' rawmode would skip
+                # cvtColor, but PIL then unpacks into a new buffer at the
+                # same cost, and the PPM path needs RGB anyway.)
+                pil_image = PILImage.frombuffer('RGB', (width, height),
+                                                np.ascontiguousarray(img_rgb),
+                                                'raw', 'RGB', 0, 1)
+                photo = self._reusable_display_photo(ImageTk.PhotoImage, width, height)
+                if photo is not None:
+                    photo.paste(pil_image)
+                else:
+                    photo = ImageTk.PhotoImage(pil_image)
+            
+            self._photo_cache[key] = photo
+            if len(self._photo_cache) > self.PHOTO_CACHE_SIZE:
+                _, evicted = self._photo_cache.popitem(last=False)
+                self._release_photos([evicted])
+        
+        previous, self._display_image = self._display_image, photo
+        
+        # Reuse a single canvas item and just point it at the new image
+        if self._canvas_image_id is None:
+            self._canvas_image_id = self.canvas.create_image(0, 0, anchor=tk.NW,
+                                                             image=photo)
+        else:
+            self.canvas.itemconfig(self._canvas_image_id, image=photo)
+        
+        # Update canvas scroll region only when the image size changed
+        display_size = (photo.width(), photo.height())
+        if display_size != self._display_size:
+            self._display_size = display_size
+            self.canvas.config(scrollregion=(0, 0) + display_size)
+        
+        # The canvas no longer shows the previous image
+        if previous is not None:
+            self._release_photos([previous])
+    
+    def _reusable_display_photo(self, photo_type: type, width: int,
+                                height: int) -> Optional[Any]:
+        """
+        Get an existing PhotoImage that new pixels can be written into.
+        
+        Slider drags redraw at a constant size, so uploading into the photo
+        already on the canvas avoids allocating a Tk image per frame. When
+        the cache is full, the least recently used photo (about to be
+        evicted anyway) is recycled the same way. The photo must be of the
+        given type (ImageTk.paste and tk PPM data are not interchangeable)
+        and already have the requested size. Any cache entry still pointing
+        at it is dropped, as its pixels are replaced.
+        
+        Args:
+            photo_type (type): ImageTk.PhotoImage or tk.PhotoImage
+            width (int): Width of the new pixels
+            height (int): Height of the new pixels
+            
+        Returns:
+            PhotoImage or None: A photo to reuse, or None if a new one has
+            to be created
+        """
+        candidates = [self._display_image]
+        if len(self._photo_cache) >= self.PHOTO_CACHE_SIZE:
+            candidates.append(next(iter(self._photo_cache.values())))
+        
+        for photo in candidates:
+            if not isinstance(photo, photo_type):
+                continue
+            if (photo.width(), photo.height()) != (width, height):
+                continue
+            
+            for stale_key in [k for k, v in self._photo_cache.items() if v is photo]:
+                del self._photo_cache[stale_key]
+            return photo
+        return None
+    
+    def _release_photos(self, photos) -> None:
+        """
+        Free the Tk image memory of photos that are no longer needed.
+        
+        Tk only deletes an image when its Python wrapper is garbage
+        collected, which can lag behind rapid zoom/undo redraws. Photos
+        still on the canvas or in _photo_cache are left alone; the
+        wrapper's own cleanup later ignores the already-deleted image.
+        
+        Args:
+            photos: PhotoImages (ImageTk or tk) to free
+        """
+        for photo in photos:
+            if photo is self._display_image:
+                continue
+            if any(cached is photo for cached in self._photo_cache.values()):
+                continue
+            try:
+                self.root.tk.call('image', 'delete', str(photo))
+            except tk.TclError:
+                pass
+    
+    def _render_display_image(self, interpolation: int) -> np.ndarray:
+        """
+        Convert the current image to RGB at the current zoom level.
+        
+        Args:
+            interpolation (int): OpenCV interpolation flag for the zoom resize
+            
+        Returns:
+            numpy.ndarray: RGB pixels; may be a reused scratch buffer, so
+            they must be copied into a PhotoImage before the next redraw
+        """
+        target_size = self._zoomed_size()
+        img_bgr = self._display_source(target_size)
+        
+        cached = self._rgb_cache
+        if (cached is not None and cached[0] == self._image_version
+                and cached[1].shape[:2] == img_bgr.shape[:2]):
+            # This zoom needs the full-resolution pixels, which are unchanged
+            # since the last conversion - only rescale. Zoom levels the
+            # thumbnail covers never get here and keep using it.
+            img_rgb = cached[1]
+            if (img_rgb.shape[1], img_rgb.shape[0]) != target_size:
+                img_rgb = self._resize_into_buffer(img_rgb, target_size,
+                                                   interpolation)
+            return img_rgb
+        
+        return self._bgr_to_display_rgb(img_bgr, target_size, interpolation)
+    
+    def _bgr_to_display_rgb(self, img_bgr: np.ndarray,
+                            target_size: Tuple[int, int],
+                            interpolation: int) -> np.ndarray:
+        """
+        Scale a BGR (or single-channel) image to target_size and convert it to RGB.
+        
+        The colour conversion is done on whichever side of the resize has
+        fewer pixels: after it when shrinking, before it when enlarging.
+        A full-resolution conversion is kept in _rgb_cache for later zooms;
+        it gets its own array rather than the shared _rgb_buf scratch.
+        
+        Args:
+            img_bgr (numpy.ndarray): Thumbnail or full-resolution BGR image
+            target_size (tuple): (width, height) of the displayed image
+            interpolation (int): OpenCV interpolation flag for the resize
+            
+        Returns:
+            numpy.ndarray: RGB pixels of size target_size
+        """
+        source_size = (img_bgr.shape[1], img_bgr.shape[0])
+        
+        if source_size[0] > target_size[0]:
+            # Shrinking: resize first so only displayed pixels are converted
+            if self._use_opencl:
+                # Both passes run on the GPU; only the result is downloaded
+                resized = cv2.resize(cv2.UMat(img_bgr), target_size,
+                                     interpolation=interpolation)
+                return cv2.cvtColor(resized, self._rgb_conversion(img_bgr)).get()
+            resized = self._resize_into_buffer(img_bgr, target_size,
+                                               interpolation)
+            return self._convert_into_buffer(resized)
+        
+        # Same size or enlarging: convert the smaller source, then resize
+        # the RGB
+        if source_size == self._display_dimensions():
+            # Full resolution: cached for later zooms, so the conversion gets
+            # an array of its own instead of the reusable _rgb_buf
+            img_rgb = cv2.cvtColor(img_bgr, self._rgb_conversion(img_bgr))
+            self._rgb_cache = (self._image_version, img_rgb)
+        else:
+            img_rgb = self._convert_into_buffer(img_bgr)
+        
+        if source_size == target_size:
+            return img_rgb
+        return self._resize_into_buffer(img_rgb, target_size, interpolation)
+    
+    def _convert_into_buffer(self, img_bgr: np.ndarray) -> np.ndarray:
+        """
+        Convert BGR to RGB, writing into the reusable _rgb_buf.
         
-        # Convert BGR to RGB for PIL
-        img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+        The PhotoImage copies the pixels it is given, so the same buffer
+        can be overwritten by the next redraw.
         
-        # Apply zoom
-        if self._zoom_level != 1.0:
-            new_width = int(img_rgb.shape[1] * self._zoom_level)
-            new_height = int(img_rgb.shape[0] * self._zoom_level)
-            img_rgb = cv2.resize(img_rgb, (new_width, new_height))
+        Args:
+            img_bgr (numpy.ndarray): BGR image to convert
+            
+        Returns:
+            numpy.ndarray: _rgb_buf holding the RGB pixels
+        """
+        shape = img_bgr.shape[:2] + (3,)
+        if self._rgb_buf is None or self._rgb_buf.shape != shape:
+            self._rgb_buf = np.empty(shape, dtype=img_bgr.dtype)
+        cv2.cvtColor(img_bgr, self._rgb_conversion(img_bgr), dst=self._rgb_buf)
+        return self._rgb_buf
+    
+    @staticmethod
+    def _rgb_conversion(img: np.ndarray) -> int:
+        """
+        Get the cvtColor code that turns an image into RGB for display.
         
-        # Convert to PIL Image
-        pil_image = PILImage.fromarray(img_rgb)
+        Edge detection produces a single-channel image, which is only
+        replicated to three channels here, at paint time.
         
-        # Convert to PhotoImage
-        self._display_image = ImageTk.PhotoImage(pil_image)
+        Args:
+            img (numpy.ndarray): BGR or single-channel image
+            
+        Returns:
+            int: cv2.COLOR_GRAY2RGB or cv2.COLOR_BGR2RGB
+        """
+        return cv2.COLOR_GRAY2RGB if img.ndim == 2 else cv2.COLOR_BGR2RGB
+    
+    def _resize_into_buffer(self, img: np.ndarray, target_size: Tuple[int, int],
+                            interpolation: int) -> np.ndarray:
+        """
+        Resize an image into the reusable _zoom_buf.
         
-        # Clear canvas and display image
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self._display_image)
+        Args:
+            img (numpy.ndarray): Image to resize
+            target_size (tuple): (width, height) of the result
+            interpolation (int): OpenCV interpolation flag
+            
+        Returns:
+            numpy.ndarray: _zoom_buf holding the resized pixels
+        """
+        shape = (target_size[1], target_size[0]) + img.shape[2:]
+        if self._zoom_buf is None or self._zoom_buf.shape != shape:
+            self._zoom_buf = np.empty(shape, dtype=img.dtype)
+        cv2.resize(img, target_size, dst=self._zoom_buf,
+                   interpolation=interpolation)
+        return self._zoom_buf
+    
+    def _display_source(self, target_size: Tuple[int, int]) -> np.ndarray:
+        """
+        Pick the smallest cached BGR image that can be scaled to target_size.
+        
+        Large images are shrunk once per edit to at most
+        DISPLAY_THUMBNAIL_SIZE pixels on the long edge. Any redraw that
+        does not need more detail than that (fit to window, zoomed out)
+        resamples the thumbnail instead of the full-resolution image.
         
-        # Update canvas scroll region
-        self.canvas.config(scrollregion=self.canvas.bbox(tk.ALL))
+        Args:
+            target_size (tuple): (width, height) of the displayed image
+            
+        Returns:
+            numpy.ndarray: Thumbnail or full-resolution current image
+        """
+        if self._preview is not None:
+            # Slider previews are already at (or below) display resolution
+            return self._preview[0]
+        
+        if self._thumbnail is None or self._thumbnail[0] != self._image_version:
+            img_bgr = self._image.current_image
+            scale = self.DISPLAY_THUMBNAIL_SIZE / max(img_bgr.shape[:2])
+            if scale >= 1.0:
+                # Already small enough; the image itself is the thumbnail
+                self._thumbnail = (self._image_version, img_bgr)
+                return img_bgr
+            # At least one pixel per edge, however thin the image
+            size = (max(1, round(img_bgr.shape[1] * scale)),
+                    max(1, round(img_bgr.shape[0] * scale)))
+            if self._use_opencl:
+                thumbnail = cv2.resize(cv2.UMat(img_bgr), size,
+                                       interpolation=cv2.INTER_AREA).get()
+            else:
+                # Most edits keep the size, so the stale thumbnail's
+                # buffer is overwritten instead of allocating a new one
+                buf = self._thumbnail_buf
+                if buf is not None and buf.shape == size[::-1] + img_bgr.shape[2:]:
+                    thumbnail = cv2.resize(img_bgr, size, dst=buf,
+                                           interpolation=cv2.INTER_AREA)
+                else:
+                    thumbnail = cv2.resize(img_bgr, size, interpolation=cv2.INTER_AREA)
+                self._thumbnail_buf = thumbnail
+            self._thumbnail = (self._image_version, thumbnail)
+        
+        thumbnail = self._thumbnail[1]
+        if thumbnail.shape[1] >= target_size[0] and thumbnail.shape[0] >= target_size[1]:
+            return thumbnail
+        
+        # Zoomed in beyond the thumbnail resolution
+        return self._image.current_image
+    
+    def _zoomed_size(self) -> Tuple[int, int]:
+        """
+        Compute the on-screen size of the current image at the current zoom level.
+        
+        Returns:
+            tuple: (width, height) in pixels, at least 1x1
+        """
+        width, height = self._display_dimensions()
+        new_width = max(1, int(width * self._zoom_level))
+        new_height = max(1, int(height * self._zoom_level))
+        return (new_width, new_height)
+    
+    def _display_dimensions(self) -> Tuple[int, int]:
+        """
+        Get the full-resolution size of what is shown on the canvas.
+        
+        Returns:
+            tuple: (width, height) of the previewed or current image
+        """
+        if self._preview is not None:
+            return self._preview[1]
+        return (self._image.width, self._image.height)
+    
+    def _display_interpolation(self) -> int:
+        """
+        Choose the OpenCV interpolation flag for scaling the display image.
+        
+        Returns:
+            int: INTER_NEAREST while zooming interactively, INTER_AREA for
+            other downscales and INTER_LINEAR for enlargements
+        """
+        if self._fast_preview:
+            return cv2.INTER_NEAREST
+        if self._zoom_level < 1.0:
+            return cv2.INTER_AREA
+        return cv2.INTER_LINEAR
+    
+    def _invalidate_display_cache(self) -> None:
+        """
+        Mark the current image as changed so the next redraw reconverts it.
+        
+        Must be called whenever the pixels of the current image are modified.
+        """
+        self._image_version += 1
+        self._rgb_cache = None
+        self._thumbnail = None
+        stale_photos = list(self._photo_cache.values())
+        self._photo_cache.clear()
+        self._release_photos(stale_photos)
     
     def _update_status(self, message: str) -> None:
         """
@@ -914,7 +2086,8 @@ class ImageEditorApp:
             message (str): Status message to display
         """
         if self._image:
-            status = f"{message} | Size: {self._image.width}x{self._image.height}"
+            width, height = self._display_dimensions()
+            status = f"{message} | Size: {width}x{height}"
         else:
             status = message
         
@@ -947,18 +2120,11 @@ Developed using:
     
     def _show_filter_info(self) -> None:
         """Show information about available filters."""
-        info = "Available Filters:\n\n"
-        
-        for key in self._filter_manager.list_filters():
-            filter_info = self._filter_manager.get_filter_info(key)
-            if filter_info:
-                info += f"• {filter_info['name']}: {filter_info['description']}\n"
-        
-        # Add statistics
-        stats = FilterManager.get_filter_statistics()
-        info += f"\nTotal Filters: {stats['total_filters']}"
-        
-        messagebox.showinfo("Filter Information", info)
+        # Cached on the app rather than keyed on the manager, so nothing
+        # outlives this window
+        if self._filter_info_text is None:
+            self._filter_info_text = _build_filter_info_text(self._filter_manager)
+        messagebox.showinfo("Filter Information", self._filter_info_text)
     
     def _exit_application(self) -> None:
         """
@@ -967,4 +2133,22 @@ Developed using:
         Demonstrates messagebox.askyesno() for confirmation dialogs.
         """
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
+            self._shutdown_workers()
             self.root.quit()
+    
+    def _shutdown_workers(self) -> None:
+        """
+        Stop the background workers before the application exits.
+        
+        Previews and permanent filters that haven't finished are dropped,
+        as their results could no longer be shown. The I/O pool is waited
+        for, so a save in progress is written out completely.
+        """
+        if self._poll_after is not None:
+            self.root.after_cancel(self._poll_after)
+            self._poll_after = None
+        self._preview_pool.shutdown(wait=False, cancel_futures=True)
+        self._filter_pool.shutdown(wait=False, cancel_futures=True)
+        self._update_status("Finishing background work...")
+        self.root.update_idletasks()
+        self._io_pool.shutdown(wait=True)
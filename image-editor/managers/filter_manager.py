@@ -11,7 +11,11 @@ OOP Concepts Demonstrated:
 - Static Methods: Utility methods
 """
 
-from typing import Dict, List, Optional
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+import cv2
 import numpy as np
 from models.image import Image
 from processors.image_processor import (
@@ -21,6 +25,58 @@ from processors.image_processor import (
 )
 
 
+class _PackedSnapshot:
+    """
+    A PNG-encoded undo snapshot.
+    
+    PNG is lossless, so unpack() gives back the exact pixels, and its
+    per-row prediction roughly halves a photo (far more for flat or
+    grayscale edits) where plain zlib of the raw bytes barely helps.
+    """
+    
+    __slots__ = ("data",)
+    
+    # Fastest zlib level; edits must not queue up behind the encoder
+    PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+    
+    def __init__(self, data: np.ndarray):
+        """
+        Wrap already encoded bytes; use pack() to encode an image.
+        
+        Args:
+            data (numpy.ndarray): Encoded PNG bytes
+        """
+        self.data = data
+    
+    @classmethod
+    def pack(cls, image: np.ndarray) -> Optional["_PackedSnapshot"]:
+        """
+        Encode an image.
+        
+        Args:
+            image (numpy.ndarray): 8-bit image to encode
+            
+        Returns:
+            _PackedSnapshot or None: None if PNG can't hold the image
+                losslessly or it wouldn't get smaller
+        """
+        if image.dtype != np.uint8:
+            return None
+        ok, data = cv2.imencode(".png", image, cls.PNG_PARAMS)
+        if not ok or data.nbytes >= image.nbytes:
+            return None
+        return cls(data)
+    
+    def unpack(self) -> np.ndarray:
+        """
+        Decode the snapshot.
+        
+        Returns:
+            numpy.ndarray: The encoded image, as a fresh array
+        """
+        return cv2.imdecode(self.data, cv2.IMREAD_UNCHANGED)
+
+
 class FilterRegistry:
     """
     Base class for managing filter registration.
@@ -72,9 +128,15 @@ class HistoryTracker:
     This class will be combined with FilterRegistry through multiple inheritance.
     """
     
+    # Entries kept before the oldest is dropped. Each is a one-line
+    # description (tens of KB in all at the limit), so unlike the undo
+    # steps a plain bound is enough and compressing them would gain nothing
+    HISTORY_LIMIT = 1000
+    
     def __init__(self):
         """Initialize the history tracker."""
-        self._history: List[str] = []
+        # Bounded so a long editing session can't grow it without limit
+        self._history: Deque[str] = deque(maxlen=self.HISTORY_LIMIT)
     
     def add_to_history(self, operation: str) -> None:
         """
@@ -87,12 +149,12 @@ class HistoryTracker:
     
     def get_history(self) -> List[str]:
         """
-        Get the complete operation history.
+        Get the operation history (the last HISTORY_LIMIT entries).
         
         Returns:
             list: List of operations performed
         """
-        return self._history.copy()
+        return list(self._history)
     
     def clear_history(self) -> None:
         """Clear the operation history."""
@@ -122,12 +184,29 @@ class FilterManager(FilterRegistry, HistoryTracker):
     Class Attributes:
         _instance (FilterManager): Singleton instance (class attribute)
         filter_count (int): Total number of filters managed
+        UNDO_LIMIT (int): Number of undo steps kept per image
+        UNPACKED_STEPS (int): Newest undo/redo steps never compressed
+        LUT_CACHE_SIZE (int): Number of point-operation tables kept
     """
     
     # Class attribute for tracking total filters across all instances
     filter_count = 0
     _instance = None  # For singleton pattern (optional)
     
+    # Undo steps share the read-only image arrays rather than copying them,
+    # but each still keeps one image alive (PNG-packed once it's older than
+    # UNPACKED_STEPS), so the oldest steps are dropped beyond this many
+    UNDO_LIMIT = 20
+    
+    # Steps closer than this to the top of a stack stay as plain arrays, so
+    # undoing or redoing the last few edits doesn't wait for a PNG decode;
+    # older ones are packed by compress_history()
+    UNPACKED_STEPS = 2
+    
+    # Slider drags keep revisiting the same few hundred brightness/contrast
+    # combinations
+    LUT_CACHE_SIZE = 512
+    
     def __init__(self):
         """
         Constructor demonstrating multiple inheritance initialization.
@@ -141,12 +220,36 @@ class FilterManager(FilterRegistry, HistoryTracker):
         
         # Instance attributes
         self._current_image: Optional[Image] = None
-        self._undo_stack: List[np.ndarray] = []
-        self._redo_stack: List[np.ndarray] = []
+        self._undo_stack: Deque[Union[np.ndarray, _PackedSnapshot]] = deque(maxlen=self.UNDO_LIMIT)
+        self._redo_stack: Deque[Union[np.ndarray, _PackedSnapshot]] = deque(maxlen=self.UNDO_LIMIT)
+        # Guards both stacks; compress_history() runs on a worker thread
+        self._stack_lock = threading.Lock()
+        # Filter descriptions, built once when each filter is registered
+        self._filter_info: Dict[str, Dict[str, str]] = {}
+        # Per-manager table cache: its keys hold this manager's filters, so
+        # it must not outlive the manager
+        self._point_lut = lru_cache(maxsize=self.LUT_CACHE_SIZE)(self._build_point_lut)
         
         # Register all available filters
         self._register_default_filters()
     
+    def register_filter(self, key: str, filter_obj: FilterProcessor) -> None:
+        """
+        Register a filter and record the info returned by get_filter_info().
+        
+        Overrides FilterRegistry.register_filter() and extends it with super().
+        
+        Args:
+            key (str): Unique identifier for the filter
+            filter_obj (FilterProcessor): Filter instance to register
+        """
+        super().register_filter(key, filter_obj)
+        self._filter_info[key] = {
+            "name": filter_obj.name,
+            "description": filter_obj.description,
+            "type": type(filter_obj).__name__
+        }
+    
     def _register_default_filters(self) -> None:
         """
         Private method to register all default filters.
@@ -187,8 +290,9 @@ class FilterManager(FilterRegistry, HistoryTracker):
         """
         self._current_image = image
         # Clear undo/redo stacks when new image is loaded
-        self._undo_stack.clear()
-        self._redo_stack.clear()
+        with self._stack_lock:
+            self._undo_stack.clear()
+            self._redo_stack.clear()
     
     def apply_filter(self, filter_key: str, **kwargs) -> bool:
         """
@@ -214,48 +318,269 @@ class FilterManager(FilterRegistry, HistoryTracker):
             return False
         
         try:
-            # Save current state for undo
-            self._undo_stack.append(self._current_image.current_image)
-            self._redo_stack.clear()  # Clear redo stack on new operation
-            
-            # Apply the filter
+            # Apply the filter; uint8 point operations go through a cached
+            # lookup table, one pass instead of a widen/add/clip chain
             current_img = self._current_image.current_image
-            processed_img = filter_obj.apply(current_img, **kwargs)
+            if filter_obj.point_operation:
+                processed_img = self._apply_point_operations(
+                    current_img, [(filter_obj, kwargs)])
+            else:
+                processed_img = filter_obj.apply(current_img, **kwargs)
             
-            # Update the image
-            self._current_image.current_image = processed_img
-            
-            # Add to history (inherited from HistoryTracker)
-            operation = f"Applied {filter_obj.name}"
-            if kwargs:
-                operation += f" with params: {kwargs}"
-            self.add_to_history(operation)
+            # Only touch undo/redo once the filter has succeeded, so a
+            # failure leaves both stacks exactly as they were. The old
+            # image moves onto the undo stack as-is; nothing is copied.
+            self.record_result(current_img, processed_img, [(filter_key, kwargs)])
             
             return True
             
         except Exception as e:
-            # Restore previous state if error occurs
-            if self._undo_stack:
-                self._undo_stack.pop()
             print(f"Error applying filter: {e}")
             return False
     
-    def undo(self) -> bool:
+    def apply_pipeline(self, operations: List[Tuple[str, Dict[str, Any]]]) -> bool:
         """
-        Undo the last operation.
+        Apply a sequence of filters to the current image as one operation.
+        
+        The whole sequence produces a single undo entry. Consecutive point
+        operations (brightness, contrast) are fused into one pass, see
+        run_pipeline().
         
+        Args:
+            operations (list): (filter_key, kwargs) pairs, applied in order
+            
         Returns:
-            bool: True if undo was successful, False otherwise
+            bool: True if successful, False otherwise
         """
-        if not self._undo_stack or self._current_image is None:
+        if self._current_image is None or not operations:
             return False
         
-        # Save current state to redo stack
-        self._redo_stack.append(self._current_image.current_image)
+        try:
+            previous_img = self._current_image.current_image
+            processed_img = self.run_pipeline(previous_img, operations)
+            self.record_result(previous_img, processed_img, operations)
+            return True
+            
+        except Exception as e:
+            print(f"Error applying filter pipeline: {e}")
+            return False
+    
+    def record_result(self, previous_img: np.ndarray, processed_img: np.ndarray,
+                      operations: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Make a result computed with run_pipeline() the current image.
+        
+        Lets callers run the filters elsewhere (e.g. on a worker thread) and
+        commit the outcome with the same undo and history bookkeeping as
+        apply_pipeline().
+        
+        Both arrays are kept as they are, without copying: previous_img on
+        the undo stack and processed_img as the new current image. Callers
+        must not write into either of them afterwards.
+        
+        Args:
+            previous_img (numpy.ndarray): Image the operations were run on;
+                undo returns to it
+            processed_img (numpy.ndarray): Output of run_pipeline()
+            operations (list): (filter_key, kwargs) pairs that produced it
+        """
+        with self._stack_lock:
+            # Save previous state for undo
+            self._undo_stack.append(previous_img)
+            self._redo_stack.clear()  # Clear redo stack on new operation
+            
+            self._current_image.current_image = processed_img
+        
+        names = [self.get_filter(key).name for key, _ in operations]
+        operation = f"Applied {' + '.join(names)}"
+        if len(operations) == 1 and operations[0][1]:
+            # Same wording as apply_filter() for a single filter
+            operation += f" with params: {operations[0][1]}"
+        self.add_to_history(operation)
+    
+    def run_pipeline(self, image: np.ndarray,
+                     operations: List[Tuple[str, Dict[str, Any]]],
+                     stage_cache: Optional[Dict[tuple, np.ndarray]] = None) -> np.ndarray:
+        """
+        Run a sequence of filters on an image without touching any state.
+        
+        Runs of consecutive point operations are composed into a single
+        256-entry lookup table and applied with one cv2.LUT pass, so e.g.
+        brightness followed by contrast reads and writes the image once.
+        The result is identical to applying the filters one by one.
+        
+        If a stage_cache dict is given, the output of every pass is stored
+        in it keyed by the operations that produced it. A later call on the
+        same image resumes from the longest cached prefix, so changing only
+        the last operation skips the passes before it. The caller must
+        clear the cache when the input image changes.
+        
+        Args:
+            image (numpy.ndarray): Input image
+            operations (list): (filter_key, kwargs) pairs, applied in order
+            stage_cache (dict): Optional cache of intermediate results
+            
+        Returns:
+            numpy.ndarray: Processed image (the input itself if operations is empty)
+            
+        Raises:
+            KeyError: If an operation names an unknown filter
+        """
+        # Resolve every filter up front: an unknown key fails before any
+        # pass runs, and the loop below does no registry lookups
+        filters = []
+        for filter_key, _ in operations:
+            filter_obj = self.get_filter(filter_key)
+            if filter_obj is None:
+                raise KeyError(f"Unknown filter: {filter_key}")
+            filters.append(filter_obj)
+        
+        keys = [(filter_key, tuple(sorted(kwargs.items())))
+                for filter_key, kwargs in operations]
+        # prefixes[i] identifies the result of the first i operations
+        prefixes = [tuple(keys[:end]) for end in range(len(keys) + 1)]
+        result = image
+        start = 0
+        
+        if stage_cache is not None:
+            # Only keep stages that are still a prefix of this pipeline
+            for key in [k for k in stage_cache if k != prefixes[min(len(k), len(keys))]]:
+                del stage_cache[key]
+            for end in range(len(keys), 0, -1):
+                cached = stage_cache.get(prefixes[end])
+                if cached is not None:
+                    result, start = cached, end
+                    break
+        
+        point_ops: List[Tuple[FilterProcessor, Dict[str, Any]]] = []
+        
+        for index in range(start, len(operations)):
+            filter_obj = filters[index]
+            kwargs = operations[index][1]
+            
+            if filter_obj.point_operation:
+                point_ops.append((filter_obj, kwargs))
+                continue
+            
+            if point_ops:
+                result = self._apply_point_operations(
+                    result, point_ops, self._scratch_for(result, image, stage_cache))
+                point_ops = []
+                if stage_cache is not None:
+                    stage_cache[prefixes[index]] = result
+            result = filter_obj.apply(result, **kwargs)
+            if stage_cache is not None:
+                stage_cache[prefixes[index + 1]] = result
+        
+        if point_ops:
+            result = self._apply_point_operations(
+                result, point_ops, self._scratch_for(result, image, stage_cache))
+            if stage_cache is not None:
+                stage_cache[prefixes[-1]] = result
+        
+        return result
+    
+    @staticmethod
+    def _scratch_for(result: np.ndarray, image: np.ndarray,
+                     stage_cache: Optional[Dict[tuple, np.ndarray]]) -> Optional[np.ndarray]:
+        """
+        Pick a buffer the next pass may overwrite instead of allocating.
+        
+        An intermediate result produced by an earlier pass of the same run
+        belongs to the pipeline alone and can be written in place. The
+        caller's input image, and anything held by a stage cache, cannot.
+        
+        Args:
+            result (numpy.ndarray): Output of the previous pass
+            image (numpy.ndarray): Pipeline input image
+            stage_cache (dict): Stage cache of this run, if any
+            
+        Returns:
+            numpy.ndarray or None: result if it can be reused, else None
+        """
+        if result is image or stage_cache is not None:
+            return None
+        return result
+    
+    def _apply_point_operations(self, image: np.ndarray,
+                                point_ops: List[Tuple[FilterProcessor, Dict[str, Any]]],
+                                dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply a run of point operations as a single lookup-table pass.
+        
+        Images that aren't uint8, and operations with parameters their
+        lookup_table() doesn't take, are run through each filter's apply()
+        instead, which handles both.
+        
+        Args:
+            image (numpy.ndarray): Input image
+            point_ops (list): (filter, kwargs) pairs of point operations
+            dst (numpy.ndarray): Optional output buffer of the same shape
+                (may be image itself); only used by the table pass
+            
+        Returns:
+            numpy.ndarray: Processed image (the input itself if point_ops is empty)
+        """
+        if not point_ops:
+            return image
+        
+        lut = None
+        if image.dtype == np.uint8:
+            try:
+                lut = self._point_lut(tuple((filter_obj, tuple(sorted(kwargs.items())))
+                                            for filter_obj, kwargs in point_ops))
+            except TypeError:
+                pass  # A parameter lookup_table() doesn't take; apply() ignores it
+        
+        if lut is None:
+            for filter_obj, kwargs in point_ops:
+                image = filter_obj.apply(image, **kwargs)
+            return image
+        
+        if dst is None:
+            return cv2.LUT(image, lut)
+        return cv2.LUT(image, lut, dst=dst)
+    
+    @staticmethod
+    def _build_point_lut(chain: Tuple[Tuple[FilterProcessor, tuple], ...]) -> np.ndarray:
+        """
+        Build the lookup table for a chain of point operations.
         
-        # Restore previous state
-        previous_state = self._undo_stack.pop()
-        self._current_image.current_image = previous_state
+        Called through the per-manager cache, _point_lut.
+        
+        Args:
+            chain (tuple): (filter, sorted kwargs items) pairs in order
+            
+        Returns:
+            numpy.ndarray: Read-only 256-entry uint8 table
+            
+        Raises:
+            TypeError: If a filter's lookup_table() doesn't take its kwargs
+        """
+        # Compose the per-filter tables: each maps the previous table's output
+        lut = np.arange(256, dtype=np.uint8)
+        for filter_obj, kwargs in chain:
+            lut = filter_obj.lookup_table(**dict(kwargs))[lut]
+        lut.setflags(write=False)
+        return lut
+    
+    def undo(self) -> bool:
+        """
+        Undo the last operation.
+        
+        Returns:
+            bool: True if undo was successful, False otherwise
+        """
+        with self._stack_lock:
+            if not self._undo_stack or self._current_image is None:
+                return False
+            
+            # Save current state to redo stack
+            self._redo_stack.append(self._current_image.current_image)
+            
+            # Restore previous state
+            previous_state = self._undo_stack.pop()
+            self._current_image.current_image = self._unpacked(previous_state)
         
         return True
     
@@ -266,17 +591,69 @@ class FilterManager(FilterRegistry, HistoryTracker):
         Returns:
             bool: True if redo was successful, False otherwise
         """
-        if not self._redo_stack or self._current_image is None:
-            return False
+        with self._stack_lock:
+            if not self._redo_stack or self._current_image is None:
+                return False
+            
+            # Save current state to undo stack
+            self._undo_stack.append(self._current_image.current_image)
+            
+            # Restore redo state
+            redo_state = self._redo_stack.pop()
+            self._current_image.current_image = self._unpacked(redo_state)
         
-        # Save current state to undo stack
-        self._undo_stack.append(self._current_image.current_image)
+        return True
+    
+    @staticmethod
+    def _unpacked(state: Union[np.ndarray, _PackedSnapshot]) -> np.ndarray:
+        """
+        Get the image an undo/redo stack entry holds.
         
-        # Restore redo state
-        redo_state = self._redo_stack.pop()
-        self._current_image.current_image = redo_state
+        Args:
+            state: Stack entry, packed or not
+            
+        Returns:
+            numpy.ndarray: The entry's image
+        """
+        if isinstance(state, _PackedSnapshot):
+            return state.unpack()
+        return state
+    
+    def compress_history(self) -> int:
+        """
+        PNG-encode the undo and redo steps older than the newest UNPACKED_STEPS.
         
-        return True
+        Encoding a large photo takes around a second, so this is meant to
+        run on a worker thread after each edit. The stacks are only locked
+        to pick the steps and to swap each packed one in; a step undone or
+        dropped in the meantime is simply skipped. The original image isn't
+        packed, since the Image keeps it in memory anyway.
+        
+        Returns:
+            int: Number of steps packed
+        """
+        with self._stack_lock:
+            original = (self._current_image.original_image
+                        if self._current_image is not None else None)
+            pending = [state
+                       for stack in (self._undo_stack, self._redo_stack)
+                       for state in list(stack)[:max(len(stack) - self.UNPACKED_STEPS, 0)]
+                       if isinstance(state, np.ndarray) and state is not original]
+        
+        packed_count = 0
+        for state in pending:
+            packed = _PackedSnapshot.pack(state)
+            if packed is None:
+                continue
+            with self._stack_lock:
+                for stack in (self._undo_stack, self._redo_stack):
+                    # Identity, not equality: the step may have moved
+                    index = next((i for i, entry in enumerate(stack) if entry is state), None)
+                    if index is not None:
+                        stack[index] = packed
+                        packed_count += 1
+                        break
+        return packed_count
     
     def can_undo(self) -> bool:
         """
@@ -338,6 +715,15 @@ class FilterManager(FilterRegistry, HistoryTracker):
         elif filter_type == "contrast":
             value = kwargs.get("value", 1.0)
             return 0.5 <= value <= 3.0
+        elif filter_type == "resize":
+            scale = kwargs.get("scale", 1.0)
+            return 0.1 <= scale <= 10.0
+        elif filter_type == "flip":
+            try:
+                FlipFilter.flip_code(kwargs.get("direction", "horizontal"))
+            except ValueError:
+                return False
+            return True
         
         return True  # No specific validation for other types
     
@@ -351,16 +737,13 @@ class FilterManager(FilterRegistry, HistoryTracker):
         Returns:
             dict or None: Dictionary with filter info or None if not found
         """
-        filter_obj = self.get_filter(filter_key)
+        info = self._filter_info.get(filter_key)
         
-        if filter_obj is None:
+        if info is None:
             return None
         
-        return {
-            "name": filter_obj.name,
-            "description": filter_obj.description,
-            "type": type(filter_obj).__name__
-        }
+        # Copy so callers can't alter the stored description
+        return info.copy()
     
     def __str__(self) -> str:
         """
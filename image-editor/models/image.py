@@ -36,12 +36,25 @@ class Image:
         _current_image (numpy.ndarray): Current working image
         _width (int): Current image width
         _height (int): Current image height
+        _load_scale (int): Factor the image was shrunk by while decoding
+        _planar (tuple): Cached per-channel planes of the current image
     """
     
     # Class attribute - shared across all Image instances
     SUPPORTED_FORMATS = ('.jpg', '.jpeg', '.png', '.bmp')
     
-    def __init__(self, filepath: str):
+    # cv2.imread flags for decoding at 1/1, 1/2, 1/4 and 1/8 resolution
+    LOAD_SCALE_FLAGS = {
+        1: cv2.IMREAD_COLOR,
+        2: cv2.IMREAD_REDUCED_COLOR_2,
+        4: cv2.IMREAD_REDUCED_COLOR_4,
+        8: cv2.IMREAD_REDUCED_COLOR_8,
+    }
+    
+    # Rows compared per step in __eq__ (small enough to stay in cache)
+    COMPARE_ROWS = 64
+    
+    def __init__(self, filepath: str, load_scale: int = 1):
         """
         Constructor to initialize an Image object.
         
@@ -50,16 +63,23 @@ class Image:
         
         Args:
             filepath (str): Path to the image file to load
+            load_scale (int): Decode at 1/load_scale resolution (1, 2, 4 or 8).
+                Reduced decoding is much faster for very large files.
             
         Raises:
             FileNotFoundError: If the image file doesn't exist
-            ValueError: If the image cannot be loaded
+            ValueError: If the image cannot be loaded or load_scale is invalid
         """
+        if load_scale not in self.LOAD_SCALE_FLAGS:
+            raise ValueError(f"Unsupported load scale: {load_scale}")
+        
         self._filepath = filepath  # Private instance attribute (encapsulation)
         self._original_image = None  # Store original for undo
         self._current_image = None  # Current working image
         self._width = 0  # Image width
         self._height = 0  # Image height
+        self._load_scale = load_scale  # Decode reduction factor
+        self._planar = None  # Built on demand by as_planar()
         
         # Load the image upon initialization
         self._load_image()
@@ -75,18 +95,42 @@ class Image:
             ValueError: If image cannot be loaded from the filepath
         """
         # Load image using OpenCV
-        image = cv2.imread(self._filepath)
+        image = cv2.imread(self._filepath, self.LOAD_SCALE_FLAGS[self._load_scale])
         
         if image is None:
             raise ValueError(f"Unable to load image from {self._filepath}")
         
-        # Store both original and current versions
-        self._original_image = image.copy()
-        self._current_image = image.copy()
+        # Both states share the freshly decoded pixels until an edit
+        # replaces the current image
+        self._original_image = self._frozen(image)
+        self._current_image = self._original_image
         
         # Store dimensions
         self._height, self._width = image.shape[:2]
     
+    @staticmethod
+    def _frozen(image: np.ndarray) -> np.ndarray:
+        """
+        Return a read-only view of an image without copying its pixels.
+        
+        An array that owns its pixels (like any fresh filter result) is
+        frozen itself, so writes through the caller's reference fail too.
+        A view of someone else's buffer can only be wrapped; its owner must
+        not write into it afterwards.
+        
+        Args:
+            image (numpy.ndarray): Image to wrap
+            
+        Returns:
+            numpy.ndarray: image itself or a view of it, not writeable
+        """
+        if image.base is None:
+            image.flags.writeable = False
+            return image
+        view = image.view()
+        view.flags.writeable = False
+        return view
+    
     # Property decorator for controlled access (getter)
     @property
     def filepath(self) -> str:
@@ -101,15 +145,25 @@ class Image:
         """
         return self._filepath
     
+    @property
+    def load_scale(self) -> int:
+        """
+        Get the factor the image was shrunk by while decoding.
+        
+        Returns:
+            int: 1 for a full-resolution decode, else 2, 4 or 8
+        """
+        return self._load_scale
+    
     @property
     def original_image(self) -> np.ndarray:
         """
         Get the original unmodified image.
         
         Returns:
-            numpy.ndarray: Copy of the original image
+            numpy.ndarray: Read-only view of the original image
         """
-        return self._original_image.copy()
+        return self._original_image
     
     @property
     def current_image(self) -> np.ndarray:
@@ -117,9 +171,10 @@ class Image:
         Get the current working image.
         
         Returns:
-            numpy.ndarray: Copy of the current image
+            numpy.ndarray: Read-only view of the current image; use clone()
+                for a writable copy
         """
-        return self._current_image.copy()
+        return self._current_image
     
     @current_image.setter
     def current_image(self, image: np.ndarray) -> None:
@@ -128,11 +183,15 @@ class Image:
         
         Demonstrates the @property.setter decorator for controlled modification.
         Allows external code to update the current image while maintaining encapsulation.
+        The array is adopted without copying and made read-only (see
+        _frozen), so callers must not modify it afterwards; filters always
+        return a fresh array.
         
         Args:
             image (numpy.ndarray): New image to set as current
         """
-        self._current_image = image.copy()
+        self._current_image = self._frozen(image)
+        self._planar = None
         self._height, self._width = image.shape[:2]
     
     @property
@@ -165,13 +224,40 @@ class Image:
         """
         return (self._width, self._height)
     
+    def clone(self) -> np.ndarray:
+        """
+        Get a writable copy of the current image.
+        
+        Returns:
+            numpy.ndarray: Copy of the current image that is safe to modify
+        """
+        return self._current_image.copy()
+    
+    def as_planar(self) -> Tuple[np.ndarray, ...]:
+        """
+        Get the current image split into one contiguous plane per channel.
+        
+        Per-channel work reads each plane with stride 1 instead of every
+        third byte of the interleaved image. The split is cached until the
+        current image changes.
+        
+        Returns:
+            tuple: Read-only (H, W) planes in channel order (B, G, R), or
+                just the one plane of a single-channel image
+        """
+        if self._planar is None:
+            self._planar = tuple(self._frozen(plane)
+                                 for plane in cv2.split(self._current_image))
+        return self._planar
+    
     def reset_to_original(self) -> None:
         """
         Reset the current image to the original state.
         
         This method is useful for implementing an undo-all functionality.
         """
-        self._current_image = self._original_image.copy()
+        self._current_image = self._original_image
+        self._planar = None
         self._height, self._width = self._original_image.shape[:2]
     
     def update_original(self) -> None:
@@ -180,7 +266,7 @@ class Image:
         
         This can be used after saving to make the current state the new baseline.
         """
-        self._original_image = self._current_image.copy()
+        self._original_image = self._current_image
     
     # Magic method: __str__ for user-friendly string representation
     def __str__(self) -> str:
@@ -226,5 +312,16 @@ class Image:
         if not isinstance(other, Image):
             return False
         
-        # Compare images pixel by pixel
-        return np.array_equal(self._current_image, other._current_image)
+        mine, theirs = self._current_image, other._current_image
+        if mine is theirs:
+            return True  # Same pixels (e.g. after reset_to_original)
+        if mine.shape != theirs.shape or mine.dtype != theirs.dtype:
+            return False
+        
+        # Compare a band of rows at a time so differing images stop at the
+        # first mismatching band instead of scanning every pixel
+        for top in range(0, mine.shape[0], self.COMPARE_ROWS):
+            bottom = top + self.COMPARE_ROWS
+            if not np.array_equal(mine[top:bottom], theirs[top:bottom]):
+                return False
+        return True
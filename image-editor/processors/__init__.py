@@ -13,6 +13,7 @@ from .image_processor import (
     BrightnessAdjustment,
     ContrastAdjustment,
     RotationFilter,
+    FlipDirection,
     FlipFilter,
     ResizeFilter
 )
@@ -26,6 +27,7 @@ __all__ = [
     'BrightnessAdjustment',
     'ContrastAdjustment',
     'RotationFilter',
+    'FlipDirection',
     'FlipFilter',
     'ResizeFilter'
 ]
@@ -14,8 +14,16 @@ OOP Concepts Demonstrated:
 
 import cv2
 import numpy as np
+import PIL
+from PIL import Image as PILImage
 from abc import ABC, abstractmethod
-from typing import Tuple
+from enum import IntEnum
+from functools import lru_cache
+from typing import Tuple, Union
+
+# Pillow-SIMD (versioned "<pillow version>.postN") has AVX2 resampling
+# kernels that beat cv2.resize on a single thread
+PILLOW_SIMD = '.post' in PIL.__version__
 
 
 class ImageProcessor(ABC):
@@ -75,12 +83,14 @@ class ImageProcessor(ABC):
         instance or class data - they're utility functions grouped with the class.
         
         Args:
-            image (numpy.ndarray): Image to validate
+            image (numpy.ndarray): Image to validate (any array with a size
+                attribute is accepted)
             
         Returns:
             bool: True if valid, False otherwise
         """
-        return image is not None and isinstance(image, np.ndarray) and image.size > 0
+        # Just a None/empty guard; the type is left to duck typing
+        return image is not None and image.size != 0
     
     @staticmethod
     def convert_to_uint8(image: np.ndarray) -> np.ndarray:
@@ -94,9 +104,10 @@ class ImageProcessor(ABC):
             numpy.ndarray: Image in uint8 format
         """
         if image.dtype != np.uint8:
-            # Clip values to valid range and convert
-            image = np.clip(image, 0, 255)
-            image = image.astype(np.uint8)
+            # Clip values to valid range and convert in one pass, writing
+            # straight into the uint8 result
+            image = np.clip(image, 0, 255, out=np.empty(image.shape, np.uint8),
+                            casting='unsafe')
         return image
     
     def __str__(self) -> str:
@@ -115,8 +126,16 @@ class FilterProcessor(ImageProcessor):
     
     Demonstrates inheritance by extending ImageProcessor.
     This class inherits all methods and attributes from ImageProcessor.
+    
+    Class Attributes:
+        point_operation (bool): True if each output pixel depends only on the
+            same input pixel value, so the filter can be baked into a lookup
+            table. Such filters provide a lookup_table() static method.
     """
     
+    # Class attribute - overridden by per-pixel filters
+    point_operation = False
+    
     def __init__(self, name: str, description: str):
         """
         Constructor for FilterProcessor.
@@ -157,6 +176,27 @@ class FilterProcessor(ImageProcessor):
         if not self.validate_image(image):
             raise ValueError("Invalid image provided")
         return image
+    
+    def apply_batch(self, batch: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Apply the filter to a stack of equally sized images.
+        
+        Point operations don't care where a pixel is, so the stack is
+        treated as one tall image and filtered with a single apply() call.
+        Other filters are applied image by image.
+        
+        Args:
+            batch (numpy.ndarray): Images stacked as (N, H, W, C)
+            **kwargs: Parameters passed to apply()
+            
+        Returns:
+            numpy.ndarray: Filtered images stacked along the first axis
+        """
+        if self.point_operation:
+            count, height = batch.shape[:2]
+            tall = self.apply(batch.reshape((count * height,) + batch.shape[2:]), **kwargs)
+            return tall.reshape(batch.shape)
+        return np.stack([self.apply(image, **kwargs) for image in batch])
 
 
 class GrayscaleFilter(FilterProcessor):
@@ -179,7 +219,7 @@ class GrayscaleFilter(FilterProcessor):
         with specific grayscale implementation.
         
         Args:
-            image (numpy.ndarray): Input BGR image
+            image (numpy.ndarray): Input BGR or single-channel image
             
         Returns:
             numpy.ndarray: Grayscale image (still in BGR format for display)
@@ -187,11 +227,12 @@ class GrayscaleFilter(FilterProcessor):
         if not self.validate_image(image):
             raise ValueError("Invalid image for grayscale conversion")
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Convert to grayscale; a single-channel image (an edge map) already is
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         
-        # Convert back to BGR for consistent display
-        return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+        # Replicate the channel back to BGR for consistent display; merge
+        # just interleaves the plane, unlike a second colour conversion
+        return cv2.merge((gray, gray, gray))
 
 
 class BlurFilter(FilterProcessor):
@@ -205,16 +246,22 @@ class BlurFilter(FilterProcessor):
         """Constructor initializing blur filter."""
         super().__init__("Blur", "Applies Gaussian blur effect")
     
-    def apply(self, image: np.ndarray, intensity: int = 5, **kwargs) -> np.ndarray:
+    def apply(self, image: np.ndarray, intensity: int = 5,
+              approximate: bool = False, out: np.ndarray = None,
+              **kwargs) -> np.ndarray:
         """
         Apply Gaussian blur.
         
         Args:
             image (numpy.ndarray): Input image
             intensity (int): Blur intensity (must be odd number)
+            approximate (bool): Trade accuracy for speed on large kernels
+                (used for interactive previews)
+            out (numpy.ndarray): Optional buffer to write the result into;
+                used only if it matches the image's shape and dtype
             
         Returns:
-            numpy.ndarray: Blurred image
+            numpy.ndarray: Blurred image (out itself if it was used)
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for blur")
@@ -222,7 +269,54 @@ class BlurFilter(FilterProcessor):
         # Ensure intensity is odd and positive
         kernel_size = max(1, intensity if intensity % 2 == 1 else intensity + 1)
         
-        return cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
+        factor = kernel_size // 4
+        if approximate and factor >= 2:
+            return self._pyramid_blur(image, factor)
+        
+        # The Gaussian is separable: one horizontal and one vertical pass
+        # with a cached 1-D kernel
+        kernel = self._gaussian_kernel(kernel_size)
+        if out is not None and out.shape == image.shape and out.dtype == image.dtype:
+            return cv2.sepFilter2D(image, -1, kernel, kernel, dst=out)
+        return cv2.sepFilter2D(image, -1, kernel, kernel)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _gaussian_kernel(kernel_size: int) -> np.ndarray:
+        """
+        Get the 1-D Gaussian kernel GaussianBlur would use for kernel_size.
+        
+        Args:
+            kernel_size (int): Odd kernel size (sigma derived from it)
+            
+        Returns:
+            numpy.ndarray: Read-only (kernel_size, 1) float kernel
+        """
+        kernel = cv2.getGaussianKernel(kernel_size, 0)
+        kernel.setflags(write=False)
+        return kernel
+    
+    @staticmethod
+    def _pyramid_blur(image: np.ndarray, factor: int) -> np.ndarray:
+        """
+        Approximate a large Gaussian blur by shrinking and re-enlarging.
+        
+        The cost no longer depends on the kernel size: the image is area
+        averaged down by factor, lightly smoothed, and bilinearly scaled
+        back to its original size.
+        
+        Args:
+            image (numpy.ndarray): Input image
+            factor (int): Downscale factor (about a quarter of the kernel size)
+            
+        Returns:
+            numpy.ndarray: Blurred image with the same shape as the input
+        """
+        height, width = image.shape[:2]
+        small = cv2.resize(image, (max(1, width // factor), max(1, height // factor)),
+                           interpolation=cv2.INTER_AREA)
+        small = cv2.GaussianBlur(small, (3, 3), 0)
+        return cv2.resize(small, (width, height), interpolation=cv2.INTER_LINEAR)
 
 
 class EdgeDetectionFilter(FilterProcessor):
@@ -242,24 +336,22 @@ class EdgeDetectionFilter(FilterProcessor):
         Apply Canny edge detection.
         
         Args:
-            image (numpy.ndarray): Input image
+            image (numpy.ndarray): Input BGR or single-channel image
             threshold1 (int): First threshold for hysteresis
             threshold2 (int): Second threshold for hysteresis
             
         Returns:
-            numpy.ndarray: Edge-detected image
+            numpy.ndarray: Single-channel (H, W) edge map; the GUI expands it
+            to colour only when displaying or saving it
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for edge detection")
         
-        # Convert to grayscale first
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Convert to grayscale first (unless it already is single-channel)
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         
         # Apply Canny edge detection
-        edges = cv2.Canny(gray, threshold1, threshold2)
-        
-        # Convert back to BGR for display
-        return cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
+        return cv2.Canny(gray, threshold1, threshold2)
 
 
 class BrightnessAdjustment(FilterProcessor):
@@ -269,29 +361,60 @@ class BrightnessAdjustment(FilterProcessor):
     Demonstrates method overriding for brightness manipulation.
     """
     
+    point_operation = True
+    
     def __init__(self):
         """Constructor initializing brightness adjustment."""
         super().__init__("Brightness", "Adjusts image brightness")
     
-    def apply(self, image: np.ndarray, value: int = 0, **kwargs) -> np.ndarray:
+    def apply(self, image: np.ndarray, value: int = 0,
+              out: np.ndarray = None, **kwargs) -> np.ndarray:
         """
         Adjust brightness.
         
         Args:
             image (numpy.ndarray): Input image
             value (int): Brightness adjustment value (-100 to 100)
+            out (numpy.ndarray): Optional uint8 buffer to write the result
+                into; used only if it matches the image's shape
             
         Returns:
-            numpy.ndarray: Brightness-adjusted image
+            numpy.ndarray: Brightness-adjusted image (out itself if it was used)
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for brightness adjustment")
         
+        if image.dtype == np.uint8:
+            # One table lookup per pixel instead of widening the whole image
+            if out is not None and out.shape == image.shape and out.dtype == image.dtype:
+                return cv2.LUT(image, self.lookup_table(value), dst=out)
+            return cv2.LUT(image, self.lookup_table(value))
+        return self._adjust(image, value)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def lookup_table(value: int = 0) -> np.ndarray:
+        """
+        Get the table mapping every uint8 value to its adjusted value.
+        
+        Args:
+            value (int): Brightness adjustment value (-100 to 100)
+            
+        Returns:
+            numpy.ndarray: Read-only 256-entry uint8 table
+        """
+        table = BrightnessAdjustment._adjust(np.arange(256, dtype=np.uint8), value)
+        table.setflags(write=False)
+        return table
+    
+    @staticmethod
+    def _adjust(image: np.ndarray, value: int) -> np.ndarray:
+        """Add value to every pixel, saturating to uint8."""
         # Add value to all pixels
         adjusted = image.astype(np.int16) + value
         
         # Ensure result is in uint8 format
-        return self.convert_to_uint8(adjusted)
+        return ImageProcessor.convert_to_uint8(adjusted)
 
 
 class ContrastAdjustment(FilterProcessor):
@@ -301,28 +424,59 @@ class ContrastAdjustment(FilterProcessor):
     Demonstrates method overriding for contrast manipulation.
     """
     
+    point_operation = True
+    
     def __init__(self):
         """Constructor initializing contrast adjustment."""
         super().__init__("Contrast", "Adjusts image contrast")
     
-    def apply(self, image: np.ndarray, value: float = 1.0, **kwargs) -> np.ndarray:
+    def apply(self, image: np.ndarray, value: float = 1.0,
+              out: np.ndarray = None, **kwargs) -> np.ndarray:
         """
         Adjust contrast.
         
         Args:
             image (numpy.ndarray): Input image
             value (float): Contrast multiplier (0.5 to 3.0)
+            out (numpy.ndarray): Optional uint8 buffer to write the result
+                into; used only if it matches the image's shape
             
         Returns:
-            numpy.ndarray: Contrast-adjusted image
+            numpy.ndarray: Contrast-adjusted image (out itself if it was used)
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for contrast adjustment")
         
+        if image.dtype == np.uint8:
+            # One table lookup per pixel instead of a float32 copy
+            if out is not None and out.shape == image.shape and out.dtype == image.dtype:
+                return cv2.LUT(image, self.lookup_table(value), dst=out)
+            return cv2.LUT(image, self.lookup_table(value))
+        return self._adjust(image, value)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def lookup_table(value: float = 1.0) -> np.ndarray:
+        """
+        Get the table mapping every uint8 value to its adjusted value.
+        
+        Args:
+            value (float): Contrast multiplier (0.5 to 3.0)
+            
+        Returns:
+            numpy.ndarray: Read-only 256-entry uint8 table
+        """
+        table = ContrastAdjustment._adjust(np.arange(256, dtype=np.uint8), value)
+        table.setflags(write=False)
+        return table
+    
+    @staticmethod
+    def _adjust(image: np.ndarray, value: float) -> np.ndarray:
+        """Multiply every pixel by value, saturating to uint8."""
         # Apply contrast adjustment
         adjusted = image.astype(np.float32) * value
         
-        return self.convert_to_uint8(adjusted)
+        return ImageProcessor.convert_to_uint8(adjusted)
 
 
 class RotationFilter(FilterProcessor):
@@ -332,39 +486,77 @@ class RotationFilter(FilterProcessor):
     Demonstrates method overriding for geometric transformations.
     """
     
+    # OpenCV rotation codes for the lossless right-angle rotations
+    ROTATE_CODES = {
+        90: cv2.ROTATE_90_CLOCKWISE,
+        180: cv2.ROTATE_180,
+        270: cv2.ROTATE_90_COUNTERCLOCKWISE
+    }
+    
     def __init__(self):
         """Constructor initializing rotation filter."""
         super().__init__("Rotation", "Rotates image by specified angle")
     
-    def apply(self, image: np.ndarray, angle: int = 90, **kwargs) -> np.ndarray:
+    def apply(self, image: np.ndarray, angle: int = 90,
+              out: np.ndarray = None, **kwargs) -> np.ndarray:
         """
         Rotate image by specified angle.
         
         Args:
             image (numpy.ndarray): Input image
             angle (int): Rotation angle (90, 180, or 270)
+            out (numpy.ndarray): Optional buffer to write the result into;
+                used only if it matches the rotated image's shape and dtype
             
         Returns:
-            numpy.ndarray: Rotated image
+            numpy.ndarray: Rotated image (out itself if it was used)
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for rotation")
         
-        # Map angle to OpenCV rotation code
-        rotation_map = {
-            90: cv2.ROTATE_90_CLOCKWISE,
-            180: cv2.ROTATE_180,
-            270: cv2.ROTATE_90_COUNTERCLOCKWISE
-        }
+        height, width = image.shape[:2]
+        if angle in (90, 270):
+            out_shape = (width, height) + image.shape[2:]
+        else:
+            out_shape = image.shape
+        if out is not None and (out.shape != out_shape or out.dtype != image.dtype):
+            out = None
         
-        if angle in rotation_map:
-            return cv2.rotate(image, rotation_map[angle])
+        if angle in self.ROTATE_CODES:
+            return cv2.rotate(image, self.ROTATE_CODES[angle], dst=out)
         else:
             # Custom angle rotation
-            height, width = image.shape[:2]
-            center = (width // 2, height // 2)
-            matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
-            return cv2.warpAffine(image, matrix, (width, height))
+            matrix = self._rotation_matrix(width, height, angle)
+            return cv2.warpAffine(image, matrix, (width, height), dst=out)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _rotation_matrix(width: int, height: int, angle: float) -> np.ndarray:
+        """
+        Get the affine matrix rotating a width x height image about its centre.
+        
+        Args:
+            width (int): Image width in pixels
+            height (int): Image height in pixels
+            angle (float): Rotation angle in degrees
+            
+        Returns:
+            numpy.ndarray: Read-only 2x3 rotation matrix
+        """
+        center = (width // 2, height // 2)
+        matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        matrix.setflags(write=False)
+        return matrix
+
+
+class FlipDirection(IntEnum):
+    """
+    Flip directions, valued as the matching OpenCV flip codes.
+    """
+    
+    HORIZONTAL = 1
+    VERTICAL = 0
+    BOTH = -1
 
 
 class FlipFilter(FilterProcessor):
@@ -374,30 +566,72 @@ class FlipFilter(FilterProcessor):
     Demonstrates method overriding for flip operations.
     """
     
+    # Flip directions by name, for callers that pass a string
+    FLIP_CODES = {
+        "horizontal": FlipDirection.HORIZONTAL,
+        "vertical": FlipDirection.VERTICAL,
+        "both": FlipDirection.BOTH,
+    }
+    
     def __init__(self):
         """Constructor initializing flip filter."""
         super().__init__("Flip", "Flips image horizontally or vertically")
     
-    def apply(self, image: np.ndarray, direction: str = "horizontal", **kwargs) -> np.ndarray:
+    @classmethod
+    def flip_code(cls, direction: Union[FlipDirection, int, str]) -> FlipDirection:
+        """
+        Resolve a flip direction to its OpenCV flip code.
+        
+        Args:
+            direction: A FlipDirection, its int value (1, 0 or -1), or a
+                name ("horizontal", "vertical" or "both", any case)
+            
+        Returns:
+            FlipDirection: The direction, usable directly as a flip code
+            
+        Raises:
+            ValueError: If the direction is not recognised
+        """
+        if isinstance(direction, str):
+            # Names already in lower case skip the lower() call
+            code = cls.FLIP_CODES.get(direction)
+            if code is None:
+                code = cls.FLIP_CODES.get(direction.lower())
+            if code is None:
+                raise ValueError(f"Unknown flip direction: {direction!r}")
+            return code
+        try:
+            return FlipDirection(direction)
+        except ValueError:
+            raise ValueError(f"Unknown flip direction: {direction!r}") from None
+    
+    def apply(self, image: np.ndarray,
+              direction: Union[FlipDirection, int, str] = FlipDirection.HORIZONTAL,
+              out: np.ndarray = None, **kwargs) -> np.ndarray:
         """
         Flip image in specified direction.
         
         Args:
             image (numpy.ndarray): Input image
-            direction (str): "horizontal" or "vertical"
+            direction: A FlipDirection, its int value, or "horizontal",
+                "vertical" or "both"
+            out (numpy.ndarray): Optional buffer to write the result into;
+                used only if it matches the image's shape and dtype
             
         Returns:
-            numpy.ndarray: Flipped image
+            numpy.ndarray: Flipped image (out itself if it was used)
+            
+        Raises:
+            ValueError: If the image or the direction is invalid
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for flip")
         
-        if direction.lower() == "horizontal":
-            return cv2.flip(image, 1)  # Flip horizontally
-        elif direction.lower() == "vertical":
-            return cv2.flip(image, 0)  # Flip vertically
-        else:
-            return cv2.flip(image, -1)  # Flip both
+        flip_code = self.flip_code(direction)
+        
+        if out is not None and (out.shape != image.shape or out.dtype != image.dtype):
+            out = None
+        return cv2.flip(image, int(flip_code), dst=out)
 
 
 class ResizeFilter(FilterProcessor):
@@ -412,7 +646,9 @@ class ResizeFilter(FilterProcessor):
         super().__init__("Resize", "Resizes image to specified dimensions")
     
     def apply(self, image: np.ndarray, width: int = None, 
-              height: int = None, scale: float = 1.0, **kwargs) -> np.ndarray:
+              height: int = None, scale: float = 1.0,
+              interpolation: int = None, out: np.ndarray = None,
+              **kwargs) -> np.ndarray:
         """
         Resize image.
         
@@ -421,18 +657,47 @@ class ResizeFilter(FilterProcessor):
             width (int): Target width (None to use scale)
             height (int): Target height (None to use scale)
             scale (float): Scale factor if width/height not specified
+            interpolation (int): OpenCV interpolation flag (None to pick
+                INTER_AREA or INTER_LINEAR automatically, or to use
+                Pillow-SIMD when it is installed)
+            out (numpy.ndarray): Optional buffer to write the result into;
+                used only if it has the target shape and dtype
             
         Returns:
-            numpy.ndarray: Resized image
+            numpy.ndarray: Resized image (out itself if it was used)
         """
         if not self.validate_image(image):
             raise ValueError("Invalid image for resize")
         
         if width and height:
             # Resize to specific dimensions
-            return cv2.resize(image, (width, height), interpolation=cv2.INTER_LINEAR)
+            new_width, new_height = width, height
         else:
             # Resize by scale factor
             new_width = int(image.shape[1] * scale)
             new_height = int(image.shape[0] * scale)
-            return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+        
+        if (out is not None and out.dtype == image.dtype
+                and out.shape == (new_height, new_width) + image.shape[2:]):
+            dst = out
+        else:
+            dst = None
+        
+        if interpolation is None and PILLOW_SIMD and dst is None:
+            # PIL treats the channels as opaque bytes, so BGR stays BGR;
+            # its BILINEAR filter is antialiased when shrinking
+            resized = PILImage.fromarray(image).resize((new_width, new_height),
+                                                       PILImage.BILINEAR)
+            return np.array(resized)
+        
+        if interpolation is None:
+            # INTER_AREA is faster and avoids aliasing when shrinking;
+            # INTER_LINEAR is used for enlargements
+            if new_width < image.shape[1] or new_height < image.shape[0]:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_LINEAR
+        if dst is None:
+            return cv2.resize(image, (new_width, new_height), interpolation=interpolation)
+        return cv2.resize(image, (new_width, new_height), dst=dst,
+                          interpolation=interpolation)
@@ -5,11 +5,15 @@ This script tests the functionality of all OOP concepts and image processing fea
 Run this to verify everything works correctly.
 """
 
+import os
+import time
+import tkinter as tk
 import cv2
 import numpy as np
 from models.image import Image
 from processors.image_processor import *
 from managers.filter_manager import FilterManager
+import gui.main_window as main_window
 
 
 def test_image_class():
@@ -39,6 +43,12 @@ def test_image_class():
     img.current_image = new_img
     print(f"✓ Property setter: Image updated to {img.dimensions}")
     
+    # Planar access splits the current image into one plane per channel
+    planes = img.as_planar()
+    assert len(planes) == 3 and np.array_equal(cv2.merge(planes), new_img)
+    assert img.as_planar() is planes
+    print(f"✓ as_planar(): {len(planes)} planes of shape {planes[0].shape}")
+    
     # Test magic methods
     print(f"✓ __str__: {str(img)}")
     print(f"✓ __repr__: {repr(img)}")
@@ -46,6 +56,12 @@ def test_image_class():
     # Test __eq__
     img2 = Image("test_image.jpg")
     print(f"✓ __eq__: img == img2 = {img == img2}")
+    assert img != img2 and img2 == Image("test_image.jpg")
+    
+    # Test reduced-resolution decoding
+    reduced = Image("test_image.jpg", load_scale=2)
+    assert reduced.dimensions == (50, 50) and reduced.load_scale == 2
+    print(f"✓ load_scale=2: Image decoded at {reduced.dimensions}")
     
     print("\n" + "="*50 + "\n")
 
@@ -60,6 +76,8 @@ def test_filter_processors():
     
     # Test static method
     print(f"✓ Static method: validate_image = {ImageProcessor.validate_image(test_img)}")
+    assert not ImageProcessor.validate_image(None)
+    assert not ImageProcessor.validate_image(np.empty((0, 0, 3), dtype=np.uint8))
     
     # Test inheritance and polymorphism
     filters = [
@@ -82,6 +100,39 @@ def test_filter_processors():
         # Test inheritance
         print(f"    Inherited name property: {filter_obj.name}")
     
+    # Flip directions may be given as a FlipDirection, its int value or a name
+    flip = FlipFilter()
+    ramp = np.arange(100 * 100 * 3, dtype=np.uint32).reshape(100, 100, 3).astype(np.uint8)
+    for direction in (FlipDirection.VERTICAL, 0, "vertical", "Vertical"):
+        assert np.array_equal(flip.apply(ramp, direction=direction), ramp[::-1])
+    assert np.array_equal(flip.apply(ramp, direction=-1), ramp[::-1, ::-1])
+    for direction in ("diagonal", 2):
+        try:
+            flip.apply(ramp, direction=direction)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"flip accepted direction {direction!r}")
+    print("✓ FlipFilter accepts FlipDirection, int and str directions")
+    
+    # Edge maps stay single-channel, and the filters after them accept that
+    edges = EdgeDetectionFilter().apply(ramp)
+    assert edges.shape == ramp.shape[:2]
+    assert np.array_equal(GrayscaleFilter().apply(edges), cv2.merge((edges, edges, edges)))
+    assert np.array_equal(EdgeDetectionFilter().apply(edges), cv2.Canny(edges, 100, 200))
+    print("✓ EdgeDetectionFilter returns a single-channel edge map")
+    
+    # Batches give the same result as filtering each image
+    print("\n✓ Testing apply_batch() on a stack of 4 images:")
+    batch = np.stack([test_img + i * 20 for i in range(4)])
+    for name, filter_obj in filters:
+        start = time.perf_counter_ns()
+        batch_result = filter_obj.apply_batch(batch)
+        elapsed_us = (time.perf_counter_ns() - start) / 1000
+        assert np.array_equal(batch_result,
+                              np.stack([filter_obj.apply(image) for image in batch]))
+        print(f"  - {name}: {elapsed_us:.0f} µs")
+    
     print("\n" + "="*50 + "\n")
 
 
@@ -103,6 +154,10 @@ def test_filter_manager():
     # Test static method
     valid = FilterManager.validate_filter_params("blur", intensity=5)
     print(f"✓ Static method: validate_filter_params() = {valid}")
+    assert FilterManager.validate_filter_params("resize", scale=2.0)
+    assert not FilterManager.validate_filter_params("resize", scale=0.0)
+    assert FilterManager.validate_filter_params("flip", direction=FlipDirection.VERTICAL)
+    assert not FilterManager.validate_filter_params("flip", direction="diagonal")
     
     # Test methods from FilterRegistry (first parent)
     print(f"\n✓ From FilterRegistry parent:")
@@ -113,11 +168,102 @@ def test_filter_manager():
     manager.add_to_history("Test operation")
     print(f"  - History: {manager.get_history()}")
     
+    # History keeps only the newest HISTORY_LIMIT entries
+    for i in range(FilterManager.HISTORY_LIMIT):
+        manager.add_to_history(f"Operation {i}")
+    history = manager.get_history()
+    assert len(history) == FilterManager.HISTORY_LIMIT and "Test operation" not in history
+    print(f"  - History bounded to {len(history)} entries")
+    
     # Test magic methods
     print(f"\n✓ Magic method __len__: len(manager) = {len(manager)}")
     print(f"✓ Magic method __contains__: 'grayscale' in manager = {'grayscale' in manager}")
     print(f"✓ Magic method __str__: {str(manager)}")
     
+    # Undo keeps at most UNDO_LIMIT steps
+    # Own file, so the shared test_image.jpg fixture stays untouched
+    cv2.imwrite("test_undo.jpg", np.zeros((20, 20, 3), dtype=np.uint8))
+    manager.current_image = Image("test_undo.jpg")
+    os.remove("test_undo.jpg")
+    states = []
+    for _ in range(FilterManager.UNDO_LIMIT + 5):
+        manager.apply_filter("brightness", value=1)
+        states.append(manager.current_image.clone())
+    # Packed steps come back with exactly the pixels they had
+    packed = manager.compress_history()
+    assert packed == FilterManager.UNDO_LIMIT - FilterManager.UNPACKED_STEPS
+    undo_steps = 0
+    while manager.undo():
+        undo_steps += 1
+        assert np.array_equal(manager.current_image.current_image, states[-1 - undo_steps])
+    assert undo_steps == FilterManager.UNDO_LIMIT
+    print(f"✓ Undo history bounded to {undo_steps} steps ({packed} PNG-packed)")
+    manager.compress_history()
+    while manager.redo():
+        undo_steps -= 1
+        assert np.array_equal(manager.current_image.current_image, states[-1 - undo_steps])
+    assert undo_steps == 0
+    print("✓ Redo restores packed steps too")
+    
+    print("\n" + "="*50 + "\n")
+
+
+def test_filter_pipeline():
+    """Test FilterManager pipelines and point-operation fusion."""
+    print("Testing Filter Pipeline...")
+    print("-" * 50)
+    
+    manager = FilterManager()
+    test_img = np.arange(100 * 100 * 3, dtype=np.uint32).reshape(100, 100, 3) % 256
+    test_img = test_img.astype(np.uint8)
+    
+    operations = [
+        ("blur", {"intensity": 5}),
+        ("brightness", {"value": -40}),
+        ("contrast", {"value": 1.7}),
+        ("resize", {"scale": 0.5}),
+    ]
+    
+    # Applying the filters one by one must match the fused pipeline
+    expected = test_img
+    for key, kwargs in operations:
+        expected = manager.get_filter(key).apply(expected, **kwargs)
+    result = manager.run_pipeline(test_img, operations)
+    
+    assert np.array_equal(result, expected)
+    print("✓ run_pipeline() matches applying each filter in turn")
+    
+    # The lookup-table path of the point operations matches plain arithmetic
+    widened = test_img.astype(np.float32)
+    assert np.array_equal(BrightnessAdjustment().apply(test_img, value=-40),
+                          np.clip(widened - 40, 0, 255).astype(np.uint8))
+    assert np.array_equal(ContrastAdjustment().apply(test_img, value=1.7),
+                          np.clip(widened * 1.7, 0, 255).astype(np.uint8))
+    print("✓ Brightness/Contrast lookup tables match direct computation")
+    
+    # Non-uint8 images and extra parameters skip the table and use apply()
+    point_chain = [("brightness", {"value": -40}), ("contrast", {"value": 1.7, "unused": 1})]
+    for image in (test_img, widened):
+        expected_points = image
+        for key, kwargs in point_chain:
+            expected_points = manager.get_filter(key).apply(expected_points, **kwargs)
+        assert np.array_equal(manager.run_pipeline(image, point_chain), expected_points)
+    print("✓ run_pipeline() falls back to apply() where a table can't be used")
+    print(f"  - Point operations: "
+          f"{[key for key, _ in operations if manager.get_filter(key).point_operation]}")
+    
+    # A stage cache must not change the result, including when only the
+    # last operations differ from the cached run
+    stage_cache = {}
+    assert np.array_equal(manager.run_pipeline(test_img, operations, stage_cache), expected)
+    changed = operations[:2] + [("contrast", {"value": 0.8})] + operations[3:]
+    expected_changed = test_img
+    for key, kwargs in changed:
+        expected_changed = manager.get_filter(key).apply(expected_changed, **kwargs)
+    assert np.array_equal(manager.run_pipeline(test_img, changed, stage_cache),
+                          expected_changed)
+    print(f"✓ run_pipeline() reuses cached stages ({len(stage_cache)} cached)")
+    
     print("\n" + "="*50 + "\n")
 
 
@@ -189,6 +335,62 @@ def test_abstract_methods():
     print("\n" + "="*50 + "\n")
 
 
+def test_undo_then_save():
+    """Test that Save after Undo writes the image the canvas shows."""
+    print("Testing Undo then Save (GUI)...")
+    print("-" * 50)
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("✓ Skipped: no display available")
+        print("\n" + "="*50 + "\n")
+        return
+    root.withdraw()
+    
+    def wait_for(condition):
+        """Run the Tk event loop until condition() holds (at most 10 s)."""
+        deadline = time.time() + 10
+        while not condition() and time.time() < deadline:
+            root.update()
+            time.sleep(0.01)
+        assert condition()
+    
+    colour_img = np.zeros((60, 80, 3), dtype=np.uint8)
+    colour_img[:, :] = (30, 0, 200)
+    cv2.imwrite("test_undo_save.png", colour_img)
+    
+    saved = []
+    showinfo = main_window.messagebox.showinfo
+    main_window.messagebox.showinfo = lambda *args, **kwargs: saved.append(args)
+    try:
+        app = main_window.ImageEditorApp(root)
+        future = app._io_pool.submit(Image, "test_undo_save.png")
+        app._pending_open = future
+        future.result()
+        app._finish_open(future, "test_undo_save.png")
+        
+        # Grayscale, preview Brightness +50, then undo the grayscale
+        app._apply_filter_permanent("grayscale")
+        wait_for(lambda: app._pending_filter is None)
+        app._brightness_var.set(50)
+        wait_for(lambda: app._preview is not None)
+        app._undo()
+        
+        app._write_image("test_undo_saved.png", "Saved")
+        wait_for(lambda: saved)
+        assert np.array_equal(cv2.imread("test_undo_saved.png"), colour_img)
+        print("✓ Save after Undo writes the restored image")
+    finally:
+        main_window.messagebox.showinfo = showinfo
+        root.destroy()
+        for path in ("test_undo_save.png", "test_undo_saved.png"):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    print("\n" + "="*50 + "\n")
+
+
 def run_all_tests():
     """Run all tests."""
     print("\n" + "="*70)
@@ -198,9 +400,11 @@ def run_all_tests():
     test_image_class()
     test_filter_processors()
     test_filter_manager()
+    test_filter_pipeline()
     test_method_overriding()
     test_super_function()
     test_abstract_methods()
+    test_undo_then_save()
     
     print("="*70)
     print(" "*20 + "ALL TESTS COMPLETED!")